@@ -1,38 +1,85 @@
 """Speaker diarization service using pyannote-audio."""
 
+import asyncio
 import io
 import os
 import json
+import uuid
+import wave
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 import soundfile as sf
 import torch
-from fastapi import FastAPI, File, Form, UploadFile, HTTPException
+from fastapi import FastAPI, File, Form, UploadFile, HTTPException, Request
 from fastapi.responses import JSONResponse
 
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
 # Initialize app
 app = FastAPI(title="Speaker Diarization Service")
 
 # Global models (loaded on startup)
 diarization_pipeline = None
 embedding_model = None
+embedding_session = None  # ONNX Runtime session replacing embedding_model when available
 speaker_embeddings = {}
 
+# Enrolled unit-norm embeddings stacked as rows, parallel to _emb_ids
+_emb_matrix = np.empty((0, 0), dtype=np.float32)
+_emb_ids: list[str] = []
+_emb_index = None  # FAISS inner-product index over _emb_matrix, when available
+_faiss_gpu_resources = None
+
+# Embedding request coalescing: up to MAX_BATCH clips, waiting at most MAX_WAIT_MS
+MAX_BATCH = int(os.environ.get("MAX_BATCH", "8"))
+MAX_WAIT_MS = float(os.environ.get("MAX_WAIT_MS", "20"))
+_embedding_queue: asyncio.Queue | None = None
+_embedding_batcher_task = None
+
+# Uploaded audio shared between requests by ID (see POST /cache)
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "16"))
+audio_cache: OrderedDict[str, bytes] = OrderedDict()
+
+# Streamed uploads still receiving PCM chunks: cache_id -> (pcm, sample_rate, channels)
+open_streams: OrderedDict[str, tuple[bytearray, int, int]] = OrderedDict()
+
 EMBEDDINGS_DIR = Path("/app/embeddings")
+ONNX_DIR = Path(os.environ.get("ONNX_DIR", "/app/onnx"))
+# Opt-in int8 weights for the CPU embedding model. Quantization shifts the cosine scores,
+# so re-check the 0.7 identification threshold on enrolled speakers before enabling it.
+ONNX_INT8 = os.environ.get("ONNX_INT8", "0") == "1"
 DEVICE = os.environ.get("DEVICE", "cuda" if torch.cuda.is_available() else "cpu")
 
 
 @app.on_event("startup")
 async def load_models():
     """Load models on startup."""
-    global diarization_pipeline, embedding_model, speaker_embeddings
+    global diarization_pipeline, embedding_model, embedding_session, speaker_embeddings
+    global _embedding_queue, _embedding_batcher_task
 
     hf_token = os.environ.get("HUGGINGFACE_TOKEN")
     if not hf_token:
         print("WARNING: HUGGINGFACE_TOKEN not set. Some models may not load.")
 
+    # Let cuDNN pick the fastest convolution algorithms for our input shapes
+    torch.backends.cudnn.benchmark = True
+
     try:
         from pyannote.audio import Pipeline, Model
 
@@ -43,6 +90,7 @@ async def load_models():
             token=hf_token
         )
         diarization_pipeline.to(torch.device(DEVICE))
+        enable_fast_embedding_path(diarization_pipeline)
         print("Diarization pipeline loaded.")
 
         # Load embedding model for speaker identification
@@ -52,54 +100,320 @@ async def load_models():
             token=hf_token
         )
         embedding_model.to(torch.device(DEVICE))
+        embedding_model.eval()
+        embedding_session = create_onnx_session(embedding_model)
+        if embedding_session is None:
+            embedding_model = optimize_embedding_model(embedding_model)
         print("Embedding model loaded.")
 
         # Load saved speaker embeddings
         load_speaker_embeddings()
 
+        # Start the embedding request batcher
+        _embedding_queue = asyncio.Queue()
+        _embedding_batcher_task = asyncio.create_task(embedding_batcher())
+
     except Exception as e:
         print(f"Error loading models: {e}")
         raise
 
 
+def enable_fast_embedding_path(pipeline):
+    """Opt the diarization pipeline into fp16 speaker embeddings on CUDA.
+
+    Newer pyannote-audio releases expose an embedding precision switch used
+    by the split forward_frames/forward_embedding fast path; older releases
+    silently keep their default behaviour.
+    """
+    if DEVICE != "cuda":
+        return
+
+    for attr in ("embedding_precision", "_embedding_precision"):
+        if hasattr(pipeline, attr):
+            setattr(pipeline, attr, torch.float16)
+            print(f"Diarization embeddings running in fp16 ({attr}).")
+            return
+
+
+def create_onnx_session(model):
+    """Export the embedding model to ONNX and open an ONNX Runtime session.
+
+    Returns None if onnxruntime is not installed or the export fails.
+    """
+    if ort is None:
+        return None
+
+    try:
+        ONNX_DIR.mkdir(parents=True, exist_ok=True)
+        onnx_path = ONNX_DIR / "embedding.onnx"
+
+        dummy = torch.zeros(1, 1, 16000, device=DEVICE)
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                dummy,
+                str(onnx_path),
+                input_names=["input"],
+                output_names=["embedding"],
+                opset_version=17,
+                dynamic_axes={"input": {0: "batch", 2: "time"}, "embedding": {0: "batch"}},
+            )
+
+        if DEVICE != "cuda" and ONNX_INT8:
+            # Dynamic int8 quantization for CPU deployments, see ONNX_INT8
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantized_path = ONNX_DIR / "embedding.int8.onnx"
+            quantize_dynamic(str(onnx_path), str(quantized_path), weight_type=QuantType.QInt8)
+            onnx_path = quantized_path
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        providers = ["CPUExecutionProvider"]
+        if DEVICE == "cuda":
+            providers.insert(0, "CUDAExecutionProvider")
+
+        session = ort.InferenceSession(str(onnx_path), options, providers=providers)
+        print(f"Embedding model served by ONNX Runtime ({session.get_providers()[0]}).")
+        return session
+    except Exception as e:
+        print(f"ONNX export failed, using PyTorch embedding model: {e}")
+        return None
+
+
+def optimize_embedding_model(model):
+    """Compile the embedding model with torch.compile, falling back to eager mode.
+
+    Compilation is lazy, so one warm-up pass runs here to keep the compile
+    cost out of the first real request.
+    """
+    try:
+        compiled = torch.compile(model, mode="reduce-overhead", fullgraph=False, dynamic=True)
+        dummy = torch.zeros(1, 1, 16000, device=DEVICE)
+        with torch.inference_mode(), torch.autocast(
+            device_type="cuda", dtype=torch.float16, enabled=DEVICE == "cuda"
+        ):
+            compiled(dummy)
+        return compiled
+    except Exception as e:
+        print(f"torch.compile failed, using eager model: {e}")
+        return model
+
+
 def load_speaker_embeddings():
-    """Load saved speaker embeddings from disk."""
+    """Load saved speaker embeddings from disk.
+
+    All embeddings live in one (N, D) array memory-mapped from all.npy;
+    index.json maps each speaker to its row. Indexes written by older
+    versions (one .npy file per speaker) are still read.
+    """
     global speaker_embeddings
 
     EMBEDDINGS_DIR.mkdir(exist_ok=True)
     index_file = EMBEDDINGS_DIR / "index.json"
+    matrix_file = EMBEDDINGS_DIR / "all.npy"
 
     if index_file.exists():
         with open(index_file) as f:
             index = json.load(f)
 
+        matrix = np.load(matrix_file, mmap_mode="r") if matrix_file.exists() else None
+
         for speaker_id, info in index.items():
-            emb_file = EMBEDDINGS_DIR / info["embedding_file"]
-            if emb_file.exists():
+            if "row" in info:
+                if matrix is None:
+                    continue
+                embedding = matrix[info["row"]]
+            else:
+                emb_file = EMBEDDINGS_DIR / info["embedding_file"]
+                if not emb_file.exists():
+                    continue
                 embedding = np.load(emb_file)
-                speaker_embeddings[speaker_id] = {
-                    "name": info["name"],
-                    "embedding": embedding,
-                    "is_user": info.get("is_user", False)
-                }
+
+            speaker_embeddings[speaker_id] = {
+                "name": info["name"],
+                "embedding_unit": to_unit(embedding),
+                "is_user": info.get("is_user", False)
+            }
         print(f"Loaded {len(speaker_embeddings)} speaker embeddings.")
 
+    rebuild_embedding_matrix()
+
+
+def to_unit(embedding: np.ndarray) -> np.ndarray:
+    """Return the embedding scaled to unit L2 norm (as-is if it already is).
+
+    The norm is clamped to 1e-12, so a zero embedding from a silent or degenerate
+    clip stays zero (scoring 0 against everyone) instead of turning into NaN.
+    """
+    norm_sq = float(np.vdot(embedding, embedding))
+    if abs(norm_sq - 1.0) < 1e-4:
+        return embedding
+    return (embedding / max(np.sqrt(norm_sq), 1e-12)).astype(np.float32)
+
+
+def rebuild_embedding_matrix():
+    """Stack enrolled unit-norm embeddings into a matrix for batched scoring."""
+    global _emb_matrix, _emb_ids, _emb_index
+
+    _emb_ids = list(speaker_embeddings.keys())
+    _emb_index = None
+    if not _emb_ids:
+        _emb_matrix = np.empty((0, 0), dtype=np.float32)
+        return
+
+    # Row-major contiguous float32 so SIMD kernels can consume it without copies
+    matrix = np.stack(
+        [speaker_embeddings[speaker_id]["embedding_unit"] for speaker_id in _emb_ids]
+    ).astype(np.float32)
+    _emb_matrix = matrix
+
+    if faiss is not None:
+        _emb_index = build_faiss_index(matrix)
+
+
+def build_faiss_index(matrix: np.ndarray):
+    """Build an inner-product FAISS index, on the GPU when one is in use."""
+    global _faiss_gpu_resources
+
+    index = faiss.IndexFlatIP(matrix.shape[1])
+    index.add(matrix)
+
+    if DEVICE == "cuda" and hasattr(faiss, "index_cpu_to_gpu"):
+        try:
+            if _faiss_gpu_resources is None:
+                _faiss_gpu_resources = faiss.StandardGpuResources()
+            index = faiss.index_cpu_to_gpu(_faiss_gpu_resources, 0, index)
+        except Exception as e:
+            print(f"FAISS GPU unavailable, using CPU index: {e}")
+
+    return index
+
+
+def search_embeddings(query: np.ndarray) -> tuple[int, float]:
+    """Return the row index and cosine score of the closest enrolled speaker."""
+    if _emb_index is not None:
+        scores, ids = _emb_index.search(query[None, :], 1)
+        return int(ids[0, 0]), float(scores[0, 0])
+
+    if simsimd is not None:
+        scores = 1.0 - np.asarray(simsimd.cdist(query[None, :], _emb_matrix, metric="cosine"))[0]
+        idx = int(scores.argmax())
+        return idx, float(scores[idx])
+
+    scores = _emb_matrix @ query
+    idx = int(scores.argmax())
+    return idx, float(scores[idx])
+
 
 def save_speaker_embeddings():
-    """Save speaker embeddings index to disk."""
+    """Save speaker embeddings as a single array plus an index to disk."""
     index = {}
-    for speaker_id, info in speaker_embeddings.items():
-        emb_file = f"{speaker_id}.npy"
-        np.save(EMBEDDINGS_DIR / emb_file, info["embedding"])
+    for row, (speaker_id, info) in enumerate(speaker_embeddings.items()):
         index[speaker_id] = {
             "name": info["name"],
-            "embedding_file": emb_file,
+            "row": row,
             "is_user": info.get("is_user", False)
         }
 
+    matrix_file = EMBEDDINGS_DIR / "all.npy"
+    if speaker_embeddings:
+        matrix = np.stack(
+            [info["embedding_unit"] for info in speaker_embeddings.values()]
+        ).astype(np.float32)
+        # Write beside and swap in: the current file may still be memory-mapped
+        tmp_file = EMBEDDINGS_DIR / "all.tmp.npy"
+        np.save(tmp_file, matrix)
+        os.replace(tmp_file, matrix_file)
+    elif matrix_file.exists():
+        matrix_file.unlink()
+
     with open(EMBEDDINGS_DIR / "index.json", "w") as f:
         json.dump(index, f, indent=2)
 
+    # Drop per-speaker files left over from the old on-disk layout
+    for legacy_file in EMBEDDINGS_DIR.glob("speaker_*.npy"):
+        legacy_file.unlink()
+
+    rebuild_embedding_matrix()
+
+
+def extract_embeddings(batch: torch.Tensor) -> np.ndarray:
+    """Run the embedding model on a (B, 1, T) batch, returning (B, D) embeddings.
+
+    Uses fp16 tensor cores on CUDA.
+    """
+    if embedding_session is not None:
+        outputs = embedding_session.run(None, {"input": batch.numpy()})
+        return outputs[0].reshape(batch.shape[0], -1)
+
+    with torch.inference_mode(), torch.autocast(
+        device_type="cuda", dtype=torch.float16, enabled=DEVICE == "cuda"
+    ):
+        embeddings = embedding_model(batch.to(DEVICE))
+    return embeddings.float().cpu().numpy().reshape(batch.shape[0], -1)
+
+
+async def embedding_batcher():
+    """Coalesce concurrent embedding requests into batched forward passes."""
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await _embedding_queue.get()]
+        deadline = loop.time() + MAX_WAIT_MS / 1000.0
+
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_embedding_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # One forward pass per clip length. Zero-padding shorter clips would pool the
+        # padded silence into their embeddings, making a speaker's embedding depend on
+        # which other requests happened to share the batch.
+        by_length: dict[int, list] = {}
+        for item in batch:
+            by_length.setdefault(item[0].shape[0], []).append(item)
+
+        for group in by_length.values():
+            waveforms = torch.stack([waveform for waveform, _ in group])
+            try:
+                embeddings = await asyncio.to_thread(extract_embeddings, waveforms.unsqueeze(1))
+            except Exception as e:
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(group, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+
+async def embed_waveform(waveform: np.ndarray) -> np.ndarray:
+    """Queue a mono waveform for embedding and wait for the batched result."""
+    if waveform.ndim == 2:
+        waveform = waveform.mean(axis=1)
+
+    future = asyncio.get_running_loop().create_future()
+    await _embedding_queue.put((torch.from_numpy(np.ascontiguousarray(waveform)), future))
+    return await future
+
+
+async def read_audio(file: UploadFile | None, cache_id: str | None) -> bytes:
+    """Get request audio from an upload or from the audio cache."""
+    if cache_id:
+        audio_bytes = audio_cache.get(cache_id)
+        if audio_bytes is None:
+            raise HTTPException(status_code=404, detail="Cached audio not found")
+        return audio_bytes
+    if file is None:
+        raise HTTPException(status_code=400, detail="file or cache_id is required")
+    return await file.read()
+
 
 @app.get("/health")
 async def health():
@@ -107,8 +421,79 @@ async def health():
     return {"status": "healthy", "device": DEVICE}
 
 
+@app.post("/cache")
+async def cache_audio(file: UploadFile = File(...)):
+    """
+    Store audio so other endpoints can reference it by ID.
+
+    Lets a client upload an utterance once and then diarize and identify
+    it without re-sending the bytes.
+    """
+    cache_id = uuid.uuid4().hex
+    store_cached_audio(cache_id, await file.read())
+    return JSONResponse({"cache_id": cache_id})
+
+
+def store_cached_audio(cache_id: str, audio_bytes: bytes):
+    """Add audio to the cache, evicting the oldest entries past CACHE_MAX_ENTRIES."""
+    audio_cache[cache_id] = audio_bytes
+    while len(audio_cache) > CACHE_MAX_ENTRIES:
+        audio_cache.popitem(last=False)
+
+
+@app.post("/cache/stream")
+async def open_audio_stream(sample_rate: int = Form(16000), channels: int = Form(1)):
+    """
+    Start a streamed upload of 16-bit PCM audio.
+
+    Chunks are appended with /cache/{cache_id}/chunk while the speaker is
+    still talking; /cache/{cache_id}/close turns them into cached WAV audio
+    usable as cache_id by the other endpoints.
+    """
+    cache_id = uuid.uuid4().hex
+    open_streams[cache_id] = (bytearray(), sample_rate, channels)
+    while len(open_streams) > CACHE_MAX_ENTRIES:
+        open_streams.popitem(last=False)
+    return JSONResponse({"cache_id": cache_id})
+
+
+@app.post("/cache/{cache_id}/chunk")
+async def append_audio_chunk(cache_id: str, request: Request):
+    """Append raw PCM bytes (the request body) to an open stream."""
+    stream = open_streams.get(cache_id)
+    if stream is None:
+        raise HTTPException(status_code=404, detail="Stream not found")
+    stream[0].extend(await request.body())
+    return JSONResponse({"success": True, "size": len(stream[0])})
+
+
+@app.post("/cache/{cache_id}/close")
+async def close_audio_stream(cache_id: str, length: int | None = Form(None)):
+    """
+    Finish a streamed upload and cache it as WAV audio.
+
+    Args:
+        length: Number of PCM bytes to keep; trailing audio past it is dropped
+    """
+    stream = open_streams.pop(cache_id, None)
+    if stream is None:
+        raise HTTPException(status_code=404, detail="Stream not found")
+    pcm, sample_rate, channels = stream
+    if length is not None:
+        del pcm[length:]
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    store_cached_audio(cache_id, buffer.getvalue())
+    return JSONResponse({"cache_id": cache_id})
+
+
 @app.post("/diarize")
-async def diarize(file: UploadFile = File(...)):
+async def diarize(file: UploadFile | None = File(None), cache_id: str | None = Form(None)):
     """
     Perform speaker diarization on audio.
 
@@ -117,11 +502,12 @@ async def diarize(file: UploadFile = File(...)):
     if diarization_pipeline is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
+    # Read audio
+    audio_bytes = await read_audio(file, cache_id)
+
     try:
-        # Read audio
-        audio_bytes = await file.read()
         audio_buffer = io.BytesIO(audio_bytes)
-        waveform, sample_rate = sf.read(audio_buffer)
+        waveform, sample_rate = sf.read(audio_buffer, dtype="float32", always_2d=False)
 
         # Convert to tensor
         if len(waveform.shape) == 1:
@@ -129,7 +515,8 @@ async def diarize(file: UploadFile = File(...)):
         elif len(waveform.shape) == 2:
             waveform = waveform.T
 
-        waveform_tensor = torch.tensor(waveform, dtype=torch.float32)
+        # Contiguous float32 on the target device lets pyannote slice chunks in place
+        waveform_tensor = torch.from_numpy(np.ascontiguousarray(waveform)).to(DEVICE)
 
         # Run diarization
         diarization = diarization_pipeline({
@@ -156,7 +543,9 @@ async def diarize(file: UploadFile = File(...)):
 
 
 @app.post("/identify")
-async def identify_speaker(file: UploadFile = File(...)):
+async def identify_speaker(
+    file: UploadFile | None = File(None), cache_id: str | None = Form(None)
+):
     """
     Identify a speaker from audio using enrolled profiles.
 
@@ -172,35 +561,21 @@ async def identify_speaker(file: UploadFile = File(...)):
             "confidence": 0.0
         })
 
+    # Read audio
+    audio_bytes = await read_audio(file, cache_id)
+
     try:
-        # Read audio
-        audio_bytes = await file.read()
         audio_buffer = io.BytesIO(audio_bytes)
-        waveform, sample_rate = sf.read(audio_buffer)
+        waveform, sample_rate = sf.read(audio_buffer, dtype="float32", always_2d=False)
 
         # Get embedding
-        if len(waveform.shape) == 1:
-            waveform = waveform.reshape(1, -1)
-        waveform_tensor = torch.tensor(waveform, dtype=torch.float32).unsqueeze(0)
-
-        with torch.no_grad():
-            embedding = embedding_model(waveform_tensor.to(DEVICE))
-            embedding = embedding.cpu().numpy().flatten()
-
-        # Find closest speaker
-        best_match = None
-        best_score = -1
-
-        for speaker_id, info in speaker_embeddings.items():
-            stored_emb = info["embedding"]
-            # Cosine similarity
-            score = np.dot(embedding, stored_emb) / (
-                np.linalg.norm(embedding) * np.linalg.norm(stored_emb)
-            )
+        embedding = await embed_waveform(waveform)
 
-            if score > best_score:
-                best_score = score
-                best_match = (speaker_id, info)
+        # Find closest speaker: stored rows are unit-norm, so cosine similarity
+        # is a plain dot product once the query is normalized
+        query = to_unit(embedding.astype(np.float32))
+        idx, best_score = search_embeddings(query)
+        best_match = (_emb_ids[idx], speaker_embeddings[_emb_ids[idx]])
 
         # Threshold for identification
         threshold = 0.7
@@ -240,16 +615,10 @@ async def enroll_speaker(
         # Read audio
         audio_bytes = await file.read()
         audio_buffer = io.BytesIO(audio_bytes)
-        waveform, sample_rate = sf.read(audio_buffer)
+        waveform, sample_rate = sf.read(audio_buffer, dtype="float32", always_2d=False)
 
         # Get embedding
-        if len(waveform.shape) == 1:
-            waveform = waveform.reshape(1, -1)
-        waveform_tensor = torch.tensor(waveform, dtype=torch.float32).unsqueeze(0)
-
-        with torch.no_grad():
-            embedding = embedding_model(waveform_tensor.to(DEVICE))
-            embedding = embedding.cpu().numpy().flatten()
+        embedding = await embed_waveform(waveform)
 
         # Generate speaker ID
         speaker_id = f"speaker_{len(speaker_embeddings)}"
@@ -262,7 +631,7 @@ async def enroll_speaker(
         # Save embedding
         speaker_embeddings[speaker_id] = {
             "name": name,
-            "embedding": embedding,
+            "embedding_unit": to_unit(embedding),
             "is_user": is_user_bool
         }
         save_speaker_embeddings()
@@ -300,11 +669,6 @@ async def delete_speaker(speaker_id: str):
     del speaker_embeddings[speaker_id]
     save_speaker_embeddings()
 
-    # Remove embedding file
-    emb_file = EMBEDDINGS_DIR / f"{speaker_id}.npy"
-    if emb_file.exists():
-        emb_file.unlink()
-
     return JSONResponse({"status": "deleted", "speaker_id": speaker_id})
 
 
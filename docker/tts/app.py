@@ -1,13 +1,12 @@
 """Text-to-Speech service using Coqui TTS."""
 
-import io
 import os
+import struct
 from typing import Optional
 
 import numpy as np
-import scipy.io.wavfile as wav
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 app = FastAPI(title="TTS Service")
@@ -29,6 +28,48 @@ tts_instances = {}
 DEVICE = os.environ.get("DEVICE", "cuda")
 
 
+def wav_header(sample_rate: int, data_len: int) -> bytes:
+    """Build a 44-byte header for mono 16-bit PCM WAV data."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_len, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_len,
+    )
+
+
+def to_pcm16(wav) -> bytes:
+    """Convert model output to 16-bit PCM bytes, normalized to its own peak."""
+    # Convert to float32 array if needed
+    wav = np.asarray(wav, dtype=np.float32)
+
+    # Scale to 16-bit range in place
+    peak = float(np.abs(wav).max()) or 1.0
+    np.multiply(wav, 32767.0 / peak, out=wav)
+    np.rint(wav, out=wav)
+
+    # Convert to 16-bit PCM
+    return wav.astype(np.int16, copy=False).tobytes()
+
+
+def to_pcm16_fixed(wav) -> bytes:
+    """Convert model output (float, nominally -1.0 to 1.0) to 16-bit PCM bytes.
+
+    Uses one fixed gain rather than normalizing to the peak, so the sentences of a
+    streamed response all come out at the same loudness.
+    """
+    # Convert to float32 array if needed
+    wav = np.asarray(wav, dtype=np.float32)
+
+    # Scale to 16-bit range in place, clipping any overshoot
+    np.clip(wav, -1.0, 1.0, out=wav)
+    np.multiply(wav, 32767.0, out=wav)
+    np.rint(wav, out=wav)
+
+    # Convert to 16-bit PCM
+    return wav.astype(np.int16, copy=False).tobytes()
+
+
 class TTSRequest(BaseModel):
     """TTS request model."""
 
@@ -89,27 +130,13 @@ async def synthesize(request: TTSRequest):
         tts = get_tts(request.language)
 
         # Generate speech
-        wav_data = tts.tts(text=request.text)
-
-        # Convert to numpy array if needed
-        if isinstance(wav_data, list):
-            wav_data = np.array(wav_data, dtype=np.float32)
-
-        # Normalize
-        wav_data = wav_data / np.max(np.abs(wav_data))
-
-        # Convert to 16-bit PCM
-        wav_int16 = (wav_data * 32767).astype(np.int16)
+        pcm = to_pcm16(tts.tts(text=request.text))
 
         # Get sample rate from model
         sample_rate = tts.synthesizer.output_sample_rate
 
-        # Write to buffer
-        buffer = io.BytesIO()
-        wav.write(buffer, sample_rate, wav_int16)
-
         return Response(
-            content=buffer.getvalue(),
+            content=wav_header(sample_rate, len(pcm)) + pcm,
             media_type="audio/wav"
         )
 
@@ -117,6 +144,30 @@ async def synthesize(request: TTSRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/tts/stream")
+async def synthesize_stream(request: TTSRequest):
+    """
+    Synthesize speech sentence by sentence.
+
+    Streams a WAV header followed by the PCM data of each sentence as soon as
+    it is generated, so playback can start before the whole text is synthesized.
+    """
+    try:
+        tts = get_tts(request.language)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    sentences = tts.synthesizer.split_into_sentences(request.text)
+
+    def generate():
+        # Total length is unknown up front; use the largest size the header allows
+        yield wav_header(tts.synthesizer.output_sample_rate, 0xFFFFFFFF - 36)
+        for sentence in sentences:
+            yield to_pcm16_fixed(tts.tts(text=sentence))
+
+    return StreamingResponse(generate(), media_type="audio/wav")
+
+
 @app.get("/languages")
 async def list_languages():
     """List supported languages."""
@@ -1,7 +1,13 @@
 """API clients for backend services."""
 
+import bisect
+import hashlib
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 
 import httpx
 
@@ -14,6 +20,12 @@ class APIError(Exception):
     pass
 
 
+def is_speakable(text: str) -> bool:
+    """Check whether text has enough content to be worth translating or speaking."""
+    stripped = text.strip()
+    return len(stripped) >= 2 and any(c.isalnum() for c in stripped)
+
+
 @dataclass
 class TranscriptionSegment:
     """A segment of transcribed speech."""
@@ -39,6 +51,15 @@ class WhisperClient:
     def __init__(self, config: Config):
         self.config = config
         self.base_url = config.whisper_url
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
 
     def transcribe(self, audio_data: bytes, language: str | None = None) -> DiarizedTranscription:
         """
@@ -51,7 +72,7 @@ class WhisperClient:
         Returns:
             DiarizedTranscription with segments
         """
-        url = f"{self.base_url}/v1/audio/transcriptions"
+        url = "/v1/audio/transcriptions"
 
         files = {"file": ("audio.wav", audio_data, "audio/wav")}
         data: dict[str, Any] = {
@@ -66,39 +87,38 @@ class WhisperClient:
             headers["Authorization"] = f"Bearer {self.config.api_key}"
 
         try:
-            with httpx.Client(timeout=60.0) as client:
-                response = client.post(url, files=files, data=data, headers=headers)
-                response.raise_for_status()
-                result = response.json()
-
-                segments = []
-                for seg in result.get("segments", []):
-                    segments.append(
-                        TranscriptionSegment(
-                            text=seg.get("text", "").strip(),
-                            start=seg.get("start", 0.0),
-                            end=seg.get("end", 0.0),
-                            speaker=None,  # Will be filled by diarization
-                        )
+            response = self._client.post(url, files=files, data=data, headers=headers)
+            response.raise_for_status()
+            result = response.json()
+
+            segments = []
+            for seg in result.get("segments", []):
+                segments.append(
+                    TranscriptionSegment(
+                        text=seg.get("text", "").strip(),
+                        start=seg.get("start", 0.0),
+                        end=seg.get("end", 0.0),
+                        speaker=None,  # Will be filled by diarization
                     )
+                )
 
-                # If no segments, create one from the text
-                if not segments and result.get("text"):
-                    segments.append(
-                        TranscriptionSegment(
-                            text=result["text"].strip(),
-                            start=0.0,
-                            end=result.get("duration", 0.0),
-                            speaker=None,
-                        )
+            # If no segments, create one from the text
+            if not segments and result.get("text"):
+                segments.append(
+                    TranscriptionSegment(
+                        text=result["text"].strip(),
+                        start=0.0,
+                        end=result.get("duration", 0.0),
+                        speaker=None,
                     )
-
-                return DiarizedTranscription(
-                    segments=segments,
-                    language=result.get("language", language or "unknown"),
-                    duration=result.get("duration", 0.0),
                 )
 
+            return DiarizedTranscription(
+                segments=segments,
+                language=result.get("language", language or "unknown"),
+                duration=result.get("duration", 0.0),
+            )
+
         except httpx.TimeoutException:
             raise APIError("Transcription request timed out")
         except httpx.HTTPStatusError as e:
@@ -113,26 +133,131 @@ class DiarizationClient:
     def __init__(self, config: Config):
         self.config = config
         self.base_url = config.diarization_url
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
 
-    def diarize(self, audio_data: bytes) -> list[dict]:
+    def cache_audio(self, audio_data: bytes) -> str:
         """
-        Perform speaker diarization on audio.
+        Upload audio once so later requests can reference it by ID.
 
         Args:
             audio_data: WAV audio data
 
         Returns:
-            List of speaker segments with start, end, speaker_id
+            Cache ID accepted by diarize() and identify_speaker()
         """
-        url = f"{self.base_url}/diarize"
+        url = "/cache"
 
         files = {"file": ("audio.wav", audio_data, "audio/wav")}
 
         try:
-            with httpx.Client(timeout=120.0) as client:
-                response = client.post(url, files=files)
-                response.raise_for_status()
-                return response.json().get("segments", [])
+            response = self._client.post(url, files=files, timeout=30.0)
+            response.raise_for_status()
+            return response.json()["cache_id"]
+
+        except Exception as e:
+            raise APIError(f"Audio upload error: {e}")
+
+    def open_stream(self, sample_rate: int, channels: int) -> str:
+        """
+        Start a streamed upload of 16-bit PCM audio.
+
+        Args:
+            sample_rate: Sample rate of the PCM chunks
+            channels: Channel count of the PCM chunks
+
+        Returns:
+            Cache ID to pass to push_chunk() and close_stream()
+        """
+        url = "/cache/stream"
+
+        data = {"sample_rate": str(sample_rate), "channels": str(channels)}
+
+        try:
+            response = self._client.post(url, data=data, timeout=10.0)
+            response.raise_for_status()
+            return response.json()["cache_id"]
+
+        except Exception as e:
+            raise APIError(f"Stream open error: {e}")
+
+    def push_chunk(self, cache_id: str, pcm: bytes) -> None:
+        """
+        Append raw PCM audio to an open stream.
+
+        Args:
+            cache_id: ID from open_stream()
+            pcm: 16-bit PCM bytes
+        """
+        url = f"/cache/{cache_id}/chunk"
+
+        try:
+            response = self._client.post(
+                url,
+                content=pcm,
+                headers={"Content-Type": "application/octet-stream"},
+                timeout=10.0,
+            )
+            response.raise_for_status()
+
+        except Exception as e:
+            raise APIError(f"Stream upload error: {e}")
+
+    def close_stream(self, cache_id: str, length: int | None = None) -> str:
+        """
+        Finish a streamed upload so it can be used like cache_audio() output.
+
+        Args:
+            cache_id: ID from open_stream()
+            length: Number of PCM bytes to keep (drops trailing audio)
+
+        Returns:
+            Cache ID accepted by diarize() and identify_speaker()
+        """
+        url = f"/cache/{cache_id}/close"
+
+        data = {} if length is None else {"length": str(length)}
+
+        try:
+            response = self._client.post(url, data=data, timeout=10.0)
+            response.raise_for_status()
+            return response.json()["cache_id"]
+
+        except Exception as e:
+            raise APIError(f"Stream close error: {e}")
+
+    def _audio_payload(
+        self, audio_data: bytes | None, cache_id: str | None
+    ) -> dict[str, Any]:
+        """Build request arguments for raw audio or a cache ID."""
+        if cache_id:
+            return {"data": {"cache_id": cache_id}}
+        return {"files": {"file": ("audio.wav", audio_data, "audio/wav")}}
+
+    def diarize(self, audio_data: bytes | None = None, cache_id: str | None = None) -> list[dict]:
+        """
+        Perform speaker diarization on audio.
+
+        Args:
+            audio_data: WAV audio data
+            cache_id: ID from cache_audio(), used instead of audio_data
+
+        Returns:
+            List of speaker segments with start, end, speaker_id
+        """
+        url = "/diarize"
+
+        try:
+            response = self._client.post(url, **self._audio_payload(audio_data, cache_id))
+            response.raise_for_status()
+            return response.json().get("segments", [])
 
         except httpx.TimeoutException:
             raise APIError("Diarization request timed out")
@@ -141,25 +266,27 @@ class DiarizationClient:
         except Exception as e:
             raise APIError(f"Diarization error: {e}")
 
-    def identify_speaker(self, audio_data: bytes) -> dict:
+    def identify_speaker(
+        self, audio_data: bytes | None = None, cache_id: str | None = None
+    ) -> dict:
         """
         Identify a speaker from audio using enrolled profiles.
 
         Args:
             audio_data: WAV audio data
+            cache_id: ID from cache_audio(), used instead of audio_data
 
         Returns:
             Speaker identification result with speaker_id and confidence
         """
-        url = f"{self.base_url}/identify"
-
-        files = {"file": ("audio.wav", audio_data, "audio/wav")}
+        url = "/identify"
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, files=files)
-                response.raise_for_status()
-                return response.json()
+            response = self._client.post(
+                url, **self._audio_payload(audio_data, cache_id), timeout=30.0
+            )
+            response.raise_for_status()
+            return response.json()
 
         except Exception as e:
             raise APIError(f"Speaker identification error: {e}")
@@ -176,16 +303,15 @@ class DiarizationClient:
         Returns:
             Enrollment result with speaker_id
         """
-        url = f"{self.base_url}/enroll"
+        url = "/enroll"
 
         files = {"file": ("audio.wav", audio_data, "audio/wav")}
         data = {"name": speaker_name, "is_user": str(is_user).lower()}
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, files=files, data=data)
-                response.raise_for_status()
-                return response.json()
+            response = self._client.post(url, files=files, data=data, timeout=30.0)
+            response.raise_for_status()
+            return response.json()
 
         except Exception as e:
             raise APIError(f"Speaker enrollment error: {e}")
@@ -197,6 +323,15 @@ class TranslationClient:
     def __init__(self, config: Config):
         self.config = config
         self.base_url = config.translation_url
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """
@@ -210,7 +345,7 @@ class TranslationClient:
         Returns:
             Translated text
         """
-        url = f"{self.base_url}/translate"
+        url = "/translate"
 
         data = {
             "q": text,
@@ -220,12 +355,55 @@ class TranslationClient:
         }
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=data)
-                response.raise_for_status()
-                result = response.json()
-                return result.get("translatedText", text)
+            response = self._client.post(url, json=data)
+            response.raise_for_status()
+            result = response.json()
+            return result.get("translatedText", text)
+
+        except httpx.TimeoutException:
+            raise APIError("Translation request timed out")
+        except httpx.HTTPStatusError as e:
+            raise APIError(f"Translation failed: {e.response.status_code}")
+        except Exception as e:
+            raise APIError(f"Translation error: {e}")
+
+    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+        """
+        Translate several texts in a single request.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Translated texts, in the same order as the input
+        """
+        if not texts:
+            return []
+
+        url = "/translate"
+
+        data = {
+            "q": texts,
+            "source": source_lang,
+            "target": target_lang,
+            "format": "text",
+        }
 
+        try:
+            response = self._client.post(url, json=data)
+            response.raise_for_status()
+            result = response.json()
+            translated = result.get("translatedText", texts)
+            if isinstance(translated, str):
+                translated = [translated]
+            if len(translated) != len(texts):
+                raise APIError("Translation returned a different number of texts")
+            return translated
+
+        except APIError:
+            raise
         except httpx.TimeoutException:
             raise APIError("Translation request timed out")
         except httpx.HTTPStatusError as e:
@@ -243,18 +421,17 @@ class TranslationClient:
         Returns:
             Detected language code
         """
-        url = f"{self.base_url}/detect"
+        url = "/detect"
 
         data = {"q": text}
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(url, json=data)
-                response.raise_for_status()
-                result = response.json()
-                if result and len(result) > 0:
-                    return result[0].get("language", "unknown")
-                return "unknown"
+            response = self._client.post(url, json=data, timeout=10.0)
+            response.raise_for_status()
+            result = response.json()
+            if result and len(result) > 0:
+                return result[0].get("language", "unknown")
+            return "unknown"
 
         except Exception:
             return "unknown"
@@ -263,9 +440,23 @@ class TranslationClient:
 class TTSClient:
     """Client for text-to-speech service."""
 
+    # Number of synthesized clips kept in memory for repeated phrases
+    CACHE_SIZE = 256
+
     def __init__(self, config: Config):
         self.config = config
         self.base_url = config.tts_url
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+        self._cache: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
 
     def synthesize(self, text: str, language: str) -> bytes:
         """
@@ -276,20 +467,72 @@ class TTSClient:
             language: Language code
 
         Returns:
-            WAV audio data
+            WAV audio data, or empty bytes if the text has nothing to speak
+        """
+        if not is_speakable(text):
+            return b""
+
+        key = (language, hashlib.blake2s(text.encode("utf-8")).digest())
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        url = "/api/tts"
+
+        data = {
+            "text": text,
+            "language": language,
+        }
+
+        try:
+            response = self._client.post(url, json=data)
+            response.raise_for_status()
+            audio = response.content
+
+        except httpx.TimeoutException:
+            raise APIError("TTS request timed out")
+        except httpx.HTTPStatusError as e:
+            raise APIError(f"TTS failed: {e.response.status_code}")
+        except Exception as e:
+            raise APIError(f"TTS error: {e}")
+
+        self._store(key, audio)
+        return audio
+
+    def stream(self, text: str, language: str) -> Iterator[bytes]:
         """
-        url = f"{self.base_url}/api/tts"
+        Synthesize speech from text, yielding WAV data as it arrives.
+
+        The first bytes are the WAV header; PCM data follows sentence by sentence.
+
+        Args:
+            text: Text to speak
+            language: Language code
+
+        Yields:
+            Chunks of WAV audio data; nothing if the text has nothing to speak
+        """
+        if not is_speakable(text):
+            return
+
+        key = (language, hashlib.blake2s(text.encode("utf-8")).digest())
+        cached = self._lookup(key)
+        if cached is not None:
+            yield cached
+            return
 
         data = {
             "text": text,
             "language": language,
         }
 
+        chunks = []
         try:
-            with httpx.Client(timeout=60.0) as client:
-                response = client.post(url, json=data)
+            with self._client.stream("POST", "/api/tts/stream", json=data) as response:
                 response.raise_for_status()
-                return response.content
+                for chunk in response.iter_bytes():
+                    chunks.append(chunk)
+                    yield chunk
 
         except httpx.TimeoutException:
             raise APIError("TTS request timed out")
@@ -298,6 +541,29 @@ class TTSClient:
         except Exception as e:
             raise APIError(f"TTS error: {e}")
 
+        # The streamed header carries placeholder sizes; fill in the real ones so the
+        # cached clip is a valid WAV for synthesize() too
+        audio = bytearray(b"".join(chunks))
+        if len(audio) >= 44:
+            struct.pack_into("<I", audio, 4, len(audio) - 8)
+            struct.pack_into("<I", audio, 40, len(audio) - 44)
+        self._store(key, bytes(audio))
+
+    def _lookup(self, key: tuple[str, bytes]) -> bytes | None:
+        """Return a cached clip and mark it recently used, or None if it is not cached."""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    def _store(self, key: tuple[str, bytes], audio: bytes) -> None:
+        """Add a synthesized clip to the cache, evicting the least recently used."""
+        with self._cache_lock:
+            self._cache[key] = audio
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
 
 class TranslationPipeline:
     """Combined pipeline for transcription, diarization, and translation."""
@@ -308,9 +574,90 @@ class TranslationPipeline:
         self.diarization = DiarizationClient(config)
         self.translation = TranslationClient(config)
         self.tts = TTSClient(config)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline")
+
+        # Streamed upload of the segment being recorded; jobs run in submission order
+        self._stream_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stream")
+        self._stream_buffer = bytearray()
+        self._stream_open = False
+        self._stream_id: str | None = None  # only touched on the stream thread
+
+    # Streamed PCM is sent once this much is buffered (~1 s of 16 kHz mono)
+    STREAM_FLUSH_BYTES = 32000
+
+    def open_stream(self, sample_rate: int, channels: int) -> None:
+        """
+        Start uploading a new segment to the diarization service as it is recorded.
+
+        push_chunk() and close_stream() must be called from the same thread.
+
+        Args:
+            sample_rate: Sample rate of the PCM chunks
+            channels: Channel count of the PCM chunks
+        """
+        self._stream_buffer = bytearray()
+        self._stream_open = True
+        self._stream_executor.submit(self._stream_open_job, sample_rate, channels)
+
+    def push_chunk(self, pcm: bytes) -> None:
+        """Queue raw PCM for the open stream, uploading in STREAM_FLUSH_BYTES batches."""
+        if not self._stream_open:
+            return
+        self._stream_buffer += pcm
+        if len(self._stream_buffer) >= self.STREAM_FLUSH_BYTES:
+            chunk, self._stream_buffer = bytes(self._stream_buffer), bytearray()
+            self._stream_executor.submit(self._stream_chunk_job, chunk)
+
+    def close_stream(self, length: int | None = None) -> Future:
+        """
+        Finish the open stream.
+
+        Args:
+            length: Number of PCM bytes in the final segment (drops trailing audio)
+
+        Returns:
+            Future resolving to a cache ID for process_audio(), or None if the
+            upload failed
+        """
+        chunk, self._stream_buffer = bytes(self._stream_buffer), bytearray()
+        was_open, self._stream_open = self._stream_open, False
+        if not was_open:
+            future: Future = Future()
+            future.set_result(None)
+            return future
+        if chunk:
+            self._stream_executor.submit(self._stream_chunk_job, chunk)
+        return self._stream_executor.submit(self._stream_close_job, length)
+
+    def _stream_open_job(self, sample_rate: int, channels: int) -> None:
+        try:
+            self._stream_id = self.diarization.open_stream(sample_rate, channels)
+        except APIError:
+            self._stream_id = None
+
+    def _stream_chunk_job(self, chunk: bytes) -> None:
+        if self._stream_id is None:
+            return
+        try:
+            self.diarization.push_chunk(self._stream_id, chunk)
+        except APIError:
+            # Audio would be incomplete; fall back to a full upload
+            self._stream_id = None
+
+    def _stream_close_job(self, length: int | None) -> str | None:
+        stream_id, self._stream_id = self._stream_id, None
+        if stream_id is None:
+            return None
+        try:
+            return self.diarization.close_stream(stream_id, length)
+        except APIError:
+            return None
 
     def process_audio(
-        self, audio_data: bytes, source_language: str | None = None
+        self,
+        audio_data: bytes,
+        source_language: str | None = None,
+        cache_future: Future | None = None,
     ) -> list[dict]:
         """
         Process audio through the full pipeline.
@@ -318,50 +665,60 @@ class TranslationPipeline:
         Args:
             audio_data: WAV audio data
             source_language: Expected source language (optional)
+            cache_future: Result of close_stream() if the segment was streamed
+                to the diarization service while recording (optional)
 
         Returns:
             List of processed segments with text, translation, speaker info
         """
-        # Step 1: Transcribe
+        # Steps 1 & 2: Transcribe and diarize concurrently
+        diarize_future = self._executor.submit(
+            self._upload_and_diarize, audio_data, cache_future
+        )
         transcription = self.whisper.transcribe(audio_data, source_language)
 
-        # Step 2: Diarize
-        try:
-            diarization_segments = self.diarization.diarize(audio_data)
-        except APIError:
+        cache_id, diarization_segments = diarize_future.result()
+        if diarization_segments is None:
             # Fall back to single speaker if diarization fails
             diarization_segments = [
                 {"start": 0, "end": transcription.duration, "speaker": 0}
             ]
 
-        # Step 3: Merge transcription with diarization
+        # Step 3: Translate all segments in one request
+        detected_lang = transcription.language
+        if detected_lang == self.config.target_language:
+            # Already in target language, translate to source
+            translate_to = self.config.source_language
+        else:
+            # Translate to target language
+            translate_to = self.config.target_language
+        # Fillers and punctuation-only segments are passed through untranslated
+        translations = [seg.text for seg in transcription.segments]
+        speakable = [i for i, seg in enumerate(transcription.segments) if is_speakable(seg.text)]
+        if speakable:
+            translated = self.translation.translate_batch(
+                [translations[i] for i in speakable], detected_lang, translate_to
+            )
+            for i, text in zip(speakable, translated):
+                translations[i] = text
+
+        # Step 4: Merge transcription with diarization
+        diarization_segments = sorted(diarization_segments, key=lambda d: d["start"])
+        diar_starts = [d["start"] for d in diarization_segments]
+
         results = []
-        for seg in transcription.segments:
-            # Find the speaker for this segment
+        for seg, translation in zip(transcription.segments, translations):
+            # Find the speaker turn containing the segment midpoint
             speaker_id = 0
-            for diar_seg in diarization_segments:
-                seg_mid = (seg.start + seg.end) / 2
-                if diar_seg["start"] <= seg_mid <= diar_seg["end"]:
-                    speaker_id = diar_seg.get("speaker", 0)
-                    break
-
-            # Step 4: Translate
-            detected_lang = transcription.language
-            if detected_lang == self.config.target_language:
-                # Already in target language, translate to source
-                translation = self.translation.translate(
-                    seg.text, detected_lang, self.config.source_language
-                )
-            else:
-                # Translate to target language
-                translation = self.translation.translate(
-                    seg.text, detected_lang, self.config.target_language
-                )
+            seg_mid = (seg.start + seg.end) / 2
+            i = bisect.bisect_right(diar_starts, seg_mid) - 1
+            if i >= 0 and diarization_segments[i]["end"] >= seg_mid:
+                speaker_id = diarization_segments[i].get("speaker", 0)
 
             # Try to identify speaker by voice
             speaker_name = None
             try:
-                id_result = self.diarization.identify_speaker(audio_data)
+                id_result = self.diarization.identify_speaker(audio_data, cache_id=cache_id)
                 if id_result and id_result.get("speaker_id") != -1:
                     speaker_name = id_result.get("speaker_name")
                     if id_result.get("confidence", 0) > 0.6:
@@ -381,6 +738,28 @@ class TranslationPipeline:
 
         return results
 
+    def _upload_and_diarize(
+        self, audio_data: bytes, cache_future: Future | None = None
+    ) -> tuple[str | None, list[dict] | None]:
+        """
+        Upload audio to the diarization service once and diarize it by ID.
+
+        Audio already streamed via cache_future is not uploaded again.
+        Returns the cache ID (None if the upload failed and raw audio was
+        sent instead) and the diarization segments (None on failure).
+        """
+        cache_id = cache_future.result() if cache_future is not None else None
+        if cache_id is None:
+            try:
+                cache_id = self.diarization.cache_audio(audio_data)
+            except APIError:
+                cache_id = None
+
+        try:
+            return cache_id, self.diarization.diarize(audio_data, cache_id=cache_id)
+        except APIError:
+            return cache_id, None
+
     def speak_translation(self, text: str, language: str) -> bytes:
         """
         Generate speech for translated text.
@@ -390,10 +769,51 @@ class TranslationPipeline:
             language: Language code
 
         Returns:
-            WAV audio data
+            WAV audio data, or empty bytes if the text has nothing to speak
         """
         return self.tts.synthesize(text, language)
 
+    def stream_tts(self, text: str, language: str) -> Iterator[bytes]:
+        """
+        Generate speech for translated text, streamed as it is synthesized.
+
+        Args:
+            text: Text to speak
+            language: Language code
+
+        Returns:
+            Iterator over WAV data chunks, starting with the header
+        """
+        return self.tts.stream(text, language)
+
+    def needs_recreate(self, config: Config) -> bool:
+        """
+        Check whether config moves any service this pipeline is connected to.
+
+        Other settings are read from the shared config at call time.
+
+        Args:
+            config: Configuration to compare against
+
+        Returns:
+            True if a new pipeline is needed to pick up the changes
+        """
+        return (
+            self.whisper.base_url != config.whisper_url
+            or self.diarization.base_url != config.diarization_url
+            or self.translation.base_url != config.translation_url
+            or self.tts.base_url != config.tts_url
+        )
+
+    def close(self) -> None:
+        """Close all service connections."""
+        self.whisper.close()
+        self.diarization.close()
+        self.translation.close()
+        self.tts.close()
+        self._executor.shutdown(wait=False)
+        self._stream_executor.shutdown(wait=False)
+
     def enroll_speaker(self, audio_data: bytes, name: str, is_user: bool = False) -> dict | None:
         """Enroll a speaker profile."""
         try:
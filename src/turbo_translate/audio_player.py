@@ -3,18 +3,30 @@
 import io
 import threading
 import wave
+from typing import Iterable
 
 import numpy as np
 
+from .recorder import WAV_HEADER_SIZE
+
 
 class AudioPlayer:
     """Plays audio data through speakers."""
 
+    # Frames per write; large enough to keep per-call overhead low
+    FRAMES_PER_BUFFER = 4096
+
     def __init__(self):
         self._pyaudio = None
         self._playing = False
         self._thread = None
 
+        # Streamed playback; the lock is held from begin_stream() until end_stream()
+        self._stream_lock = threading.Lock()
+        self._stream = None
+        self._frame_size = 0
+        self._pending = b""
+
     def _init_pyaudio(self):
         """Initialize PyAudio."""
         if self._pyaudio is None:
@@ -46,28 +58,136 @@ class AudioPlayer:
         try:
             buffer = io.BytesIO(wav_data)
             with wave.open(buffer, "rb") as wf:
-                stream = self._pyaudio.open(
-                    format=self._pyaudio.get_format_from_width(wf.getsampwidth()),
-                    channels=wf.getnchannels(),
-                    rate=wf.getframerate(),
-                    output=True,
-                )
+                channels = wf.getnchannels()
+                sample_width = wf.getsampwidth()
+                rate = wf.getframerate()
+                frames = memoryview(wf.readframes(wf.getnframes()))
+
+            stream = self._pyaudio.open(
+                format=self._pyaudio.get_format_from_width(sample_width),
+                channels=channels,
+                rate=rate,
+                output=True,
+                frames_per_buffer=self.FRAMES_PER_BUFFER,
+            )
+
+            self._playing = True
+            chunk_size = self.FRAMES_PER_BUFFER * channels * sample_width
+
+            for offset in range(0, len(frames), chunk_size):
+                if not self._playing:
+                    break
+                stream.write(frames[offset:offset + chunk_size])
 
-                self._playing = True
-                chunk_size = 1024
-                data = wf.readframes(chunk_size)
+            stream.stop_stream()
+            stream.close()
 
-                while data and self._playing:
-                    stream.write(data)
-                    data = wf.readframes(chunk_size)
+        except Exception as e:
+            print(f"Audio playback error: {e}")
+        finally:
+            self._playing = False
+
+    def play_stream(self, chunks: Iterable[bytes]):
+        """
+        Play WAV audio data while it is still arriving.
 
-                stream.stop_stream()
-                stream.close()
+        Blocks until the data is exhausted or playback is stopped.
+
+        Args:
+            chunks: WAV data in arbitrary pieces, starting with the header
+        """
+        chunks = iter(chunks)
+        header = b""
+        for chunk in chunks:
+            header += chunk
+            if len(header) >= WAV_HEADER_SIZE:
+                break
+        else:
+            return
+
+        try:
+            with wave.open(io.BytesIO(header[:WAV_HEADER_SIZE]), "rb") as wf:
+                channels = wf.getnchannels()
+                sample_width = wf.getsampwidth()
+                rate = wf.getframerate()
+        except Exception as e:
+            print(f"Audio playback error: {e}")
+            return
+
+        self.begin_stream(rate, channels, sample_width)
+        try:
+            if self.write(header[WAV_HEADER_SIZE:]):
+                for chunk in chunks:
+                    if not self.write(chunk):
+                        break
+        finally:
+            self.end_stream()
 
+    def begin_stream(self, sample_rate: int, channels: int, sample_width: int = 2):
+        """
+        Open an output stream for raw PCM data; waits for any other stream to end.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            channels: Number of channels
+            sample_width: Bytes per sample
+        """
+        self._stream_lock.acquire()
+        self._init_pyaudio()
+        try:
+            self._stream = self._pyaudio.open(
+                format=self._pyaudio.get_format_from_width(sample_width),
+                channels=channels,
+                rate=sample_rate,
+                output=True,
+                frames_per_buffer=self.FRAMES_PER_BUFFER,
+            )
+        except Exception as e:
+            print(f"Audio playback error: {e}")
+            self._stream = None
+        self._frame_size = channels * sample_width
+        self._pending = b""
+        self._playing = True
+
+    def write(self, data: bytes) -> bool:
+        """
+        Play a piece of PCM data on the open stream.
+
+        Args:
+            data: Raw PCM data; need not end on a frame boundary
+
+        Returns:
+            False once playback has been stopped or the stream failed
+        """
+        if not self._playing or self._stream is None:
+            return False
+
+        if self._pending:
+            data = self._pending + data
+        usable = len(data) - len(data) % self._frame_size
+        self._pending = data[usable:]
+
+        try:
+            if usable:
+                self._stream.write(data[:usable])
+        except Exception as e:
+            print(f"Audio playback error: {e}")
+            return False
+        return True
+
+    def end_stream(self):
+        """Finish playing the open stream and release it."""
+        try:
+            if self._stream is not None:
+                self._stream.stop_stream()
+                self._stream.close()
         except Exception as e:
             print(f"Audio playback error: {e}")
         finally:
+            self._stream = None
+            self._pending = b""
             self._playing = False
+            self._stream_lock.release()
 
     def stop(self):
         """Stop playback."""
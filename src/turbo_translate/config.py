@@ -1,10 +1,55 @@
 """Configuration management for Turbo Translate."""
 
+import array
+import functools
 import json
 import os
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, Iterable, Iterator, TypedDict
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+_IS_WINDOWS = os.name == "nt"
+
+
+@functools.cache
+def _config_dir() -> Path:
+    """Resolve and create the configuration directory (once per process)."""
+    if _IS_WINDOWS:
+        base = Path(os.environ.get("APPDATA", Path.home()))
+    else:
+        base = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
+    config_dir = base / "turbo-translate"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
+
+@functools.cache
+def _config_subdir(name: str) -> Path:
+    """Resolve and create a subdirectory of the configuration directory (once per process)."""
+    subdir = _config_dir() / name
+    subdir.mkdir(parents=True, exist_ok=True)
+    return subdir
 
 
 class HistoryEntry(TypedDict):
@@ -18,6 +63,65 @@ class HistoryEntry(TypedDict):
     wav_filename: str | None
 
 
+@dataclass
+class HistoryBuffer:
+    """Transcription history stored column-wise, one list per HistoryEntry field."""
+
+    texts: list[str] = field(default_factory=list)
+    translations: list[str] = field(default_factory=list)
+    timestamps: list[str] = field(default_factory=list)
+    speakers: list[str] = field(default_factory=list)
+    speaker_ids: array.array = field(default_factory=lambda: array.array("i"))
+    wav_filenames: list[str | None] = field(default_factory=list)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[HistoryEntry]) -> "HistoryBuffer":
+        """Build a buffer from row-wise entries."""
+        buffer = cls()
+        for entry in entries:
+            buffer.append(entry)
+        return buffer
+
+    def append(self, entry: HistoryEntry) -> None:
+        """Append one entry."""
+        self.texts.append(entry["text"])
+        self.translations.append(entry["translation"])
+        self.timestamps.append(entry["timestamp"])
+        self.speakers.append(entry["speaker"])
+        self.speaker_ids.append(entry["speaker_id"])
+        self.wav_filenames.append(entry.get("wav_filename"))
+
+    def drop_oldest(self, count: int) -> list[str]:
+        """Remove the oldest entries, returning the recordings they referenced."""
+        dropped = [name for name in self.wav_filenames[:count] if name]
+        for column in (
+            self.texts,
+            self.translations,
+            self.timestamps,
+            self.speakers,
+            self.speaker_ids,
+            self.wav_filenames,
+        ):
+            del column[:count]
+        return dropped
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index: int) -> HistoryEntry:
+        return {
+            "text": self.texts[index],
+            "translation": self.translations[index],
+            "timestamp": self.timestamps[index],
+            "speaker": self.speakers[index],
+            "speaker_id": self.speaker_ids[index],
+            "wav_filename": self.wav_filenames[index],
+        }
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        return (self[i] for i in range(len(self)))
+
+
 class SpeakerProfile(TypedDict):
     """Speaker profile for voice recognition."""
 
@@ -84,7 +188,7 @@ class Config:
     # History settings
     max_history: int = 100
     save_recordings: bool = True
-    history: list[HistoryEntry] = field(default_factory=list)
+    history: HistoryBuffer = field(default_factory=HistoryBuffer)
 
     # Speaker profiles
     speaker_profiles: list[SpeakerProfile] = field(default_factory=list)
@@ -94,61 +198,137 @@ class Config:
     tts_enabled: bool = True
     continuous_listening: bool = True
 
+    # Service URLs derived from server_host and the ports, see rebuild_urls()
+    whisper_url: str = field(default="", init=False)
+    diarization_url: str = field(default="", init=False)
+    translation_url: str = field(default="", init=False)
+    tts_url: str = field(default="", init=False)
+
+    # Derived from speaker_profiles/speaker_colors, see refresh_speaker_cache()
+    _speaker_names: dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    _num_colors: int = field(default=0, init=False, repr=False)
+
+    # Lines currently in history.jsonl, including entries already trimmed from history
+    _history_lines: int = field(default=0, init=False, repr=False)
+
+    # Pending debounced save, see _schedule_save()
+    _save_timer: threading.Timer | None = field(default=None, init=False, repr=False)
+    _save_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    # Seconds to wait for further changes before writing a scheduled save
+    SAVE_DELAY = 1.0
+
+    def __post_init__(self):
+        self.rebuild_urls()
+        self.refresh_speaker_cache()
+
+    def rebuild_urls(self) -> None:
+        """Recompute the service URLs; call after changing server_host or a port."""
+        base = f"http://{self.server_host}"
+        self.whisper_url = f"{base}:{self.whisper_port}"
+        self.diarization_url = f"{base}:{self.diarization_port}"
+        self.translation_url = f"{base}:{self.translation_port}"
+        self.tts_url = f"{base}:{self.tts_port}"
+
+    def refresh_speaker_cache(self) -> None:
+        """Rebuild speaker name/color lookups; call after changing profiles or colors."""
+        self._speaker_names = {}
+        for profile in self.speaker_profiles:
+            if profile.get("is_user"):
+                self._speaker_names[0] = profile["name"]
+                break
+        self._num_colors = len(self.speaker_colors)
+
     @classmethod
     def get_config_dir(cls) -> Path:
         """Get the configuration directory."""
-        if os.name == "nt":
-            base = Path(os.environ.get("APPDATA", Path.home()))
-        else:
-            base = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
-        config_dir = base / "turbo-translate"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir
+        return _config_dir()
 
     @classmethod
     def get_config_path(cls) -> Path:
         """Get the configuration file path."""
         return cls.get_config_dir() / "config.json"
 
+    @classmethod
+    def get_history_path(cls) -> Path:
+        """Get the append-only history log path (one JSON entry per line)."""
+        return cls.get_config_dir() / "history.jsonl"
+
     @classmethod
     def get_recordings_dir(cls) -> Path:
         """Get the recordings directory."""
-        recordings_dir = cls.get_config_dir() / "recordings"
-        recordings_dir.mkdir(parents=True, exist_ok=True)
-        return recordings_dir
+        return _config_subdir("recordings")
 
     @classmethod
     def get_embeddings_dir(cls) -> Path:
         """Get the speaker embeddings directory."""
-        embeddings_dir = cls.get_config_dir() / "embeddings"
-        embeddings_dir.mkdir(parents=True, exist_ok=True)
-        return embeddings_dir
+        return _config_subdir("embeddings")
 
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from file."""
         config_path = cls.get_config_path()
+        config = None
+        legacy_history = None
         if config_path.exists():
             try:
-                with open(config_path) as f:
-                    data = json.load(f)
+                data = _loads(config_path.read_bytes())
                 # Handle nested fields
-                history = data.pop("history", [])
+                legacy_history = data.pop("history", None)
                 speaker_profiles = data.pop("speaker_profiles", [])
                 speaker_colors = data.pop("speaker_colors", None)
 
-                config = cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
-                config.history = history
+                config = cls(**{k: v for k, v in data.items() if k in _FIELD_NAMES})
                 config.speaker_profiles = speaker_profiles
                 if speaker_colors:
                     config.speaker_colors = speaker_colors
-                return config
+                config.refresh_speaker_cache()
             except Exception as e:
                 print(f"Error loading config: {e}")
-        return cls()
+        if config is None:
+            config = cls()
+
+        if legacy_history is not None:
+            # Older versions kept history inside config.json; the next save moves it out
+            config.history = HistoryBuffer.from_entries(legacy_history[-config.max_history:])
+        else:
+            config._load_history()
+        return config
+
+    def _load_history(self) -> None:
+        """Read the history log, keeping the newest max_history entries."""
+        history_path = self.get_history_path()
+        if not history_path.exists():
+            return
+        entries = []
+        try:
+            for line in history_path.read_bytes().splitlines():
+                if line.strip():
+                    entries.append(_loads(line))
+        except Exception as e:
+            print(f"Error loading history: {e}")
+        self._history_lines = len(entries)
+        self.history = HistoryBuffer.from_entries(entries[-self.max_history:])
 
     def save(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file, superseding any scheduled save."""
+        timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+        self._do_save()
+
+    def _schedule_save(self) -> None:
+        """Save after SAVE_DELAY seconds, coalescing bursts of changes into one write."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self._do_save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _do_save(self) -> None:
+        """Write configuration atomically via a temporary file."""
         config_path = self.get_config_path()
         data = {
             "server_host": self.server_host,
@@ -178,14 +358,31 @@ class Config:
             "speaker_colors": self.speaker_colors,
             "max_history": self.max_history,
             "save_recordings": self.save_recordings,
-            "history": self.history,
             "speaker_profiles": self.speaker_profiles,
             "auto_translate": self.auto_translate,
             "tts_enabled": self.tts_enabled,
             "continuous_listening": self.continuous_listening,
         }
-        with open(config_path, "w") as f:
-            json.dump(data, f, indent=2)
+        payload = _dumps(data)
+        tmp_path = config_path.with_suffix(".json.tmp")
+        with self._save_lock:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, config_path)
+            if self._history_lines != len(self.history):
+                self._compact_history()
+
+    def _compact_history(self) -> None:
+        """Rewrite the history log with only the retained entries.
+
+        Caller must hold _save_lock.
+        """
+        history_path = self.get_history_path()
+        tmp_path = history_path.with_suffix(".jsonl.tmp")
+        entries = list(self.history)
+        lines = "".join(json.dumps(entry) + "\n" for entry in entries)
+        tmp_path.write_text(lines, encoding="utf-8")
+        os.replace(tmp_path, history_path)
+        self._history_lines = len(entries)
 
     def add_to_history(
         self,
@@ -208,49 +405,59 @@ class Config:
         }
 
         # Check for duplicates
-        if self.history and self.history[-1]["text"] == text:
+        if self.history.texts and self.history.texts[-1] == text:
             return
 
-        self.history.append(entry)
+        with self._save_lock:
+            self.history.append(entry)
+            with open(self.get_history_path(), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._history_lines += 1
+
+            # Trim history
+            excess = len(self.history) - self.max_history
+            wav_filenames = self.history.drop_oldest(excess) if excess > 0 else []
+
+        # Delete old recordings in the background
+        if wav_filenames:
+            threading.Thread(
+                target=self._delete_recordings, args=(wav_filenames,), daemon=True
+            ).start()
 
-        # Trim history
-        while len(self.history) > self.max_history:
-            old_entry = self.history.pop(0)
-            if old_entry.get("wav_filename"):
-                wav_path = self.get_recordings_dir() / old_entry["wav_filename"]
-                if wav_path.exists():
-                    wav_path.unlink()
+        # The log keeps trimmed entries until it is compacted
+        if self._history_lines > 2 * self.max_history:
+            self._schedule_save()
 
-        self.save()
+    @classmethod
+    def _delete_recordings(cls, wav_filenames: list[str]) -> None:
+        """Delete recordings by name, resolving the recordings directory only once."""
+        recordings_dir = cls.get_recordings_dir()
+        if os.unlink not in os.supports_dir_fd or not hasattr(os, "O_DIRECTORY"):
+            for name in wav_filenames:
+                (recordings_dir / name).unlink(missing_ok=True)
+            return
+
+        dir_fd = os.open(recordings_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for name in wav_filenames:
+                try:
+                    os.unlink(name, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    pass
+        finally:
+            os.close(dir_fd)
 
     def get_speaker_color(self, speaker_id: int) -> str:
         """Get color for a speaker ID."""
-        return self.speaker_colors[speaker_id % len(self.speaker_colors)]
+        return self.speaker_colors[speaker_id % self._num_colors]
 
     def get_speaker_name(self, speaker_id: int) -> str:
         """Get name for a speaker ID."""
-        for profile in self.speaker_profiles:
-            # Check if this profile matches the speaker
-            if profile.get("is_user") and speaker_id == 0:
-                return profile["name"]
+        name = self._speaker_names.get(speaker_id)
+        if name is not None:
+            return name
         return f"Speaker {speaker_id + 1}"
 
-    @property
-    def whisper_url(self) -> str:
-        """Get the Whisper API URL."""
-        return f"http://{self.server_host}:{self.whisper_port}"
-
-    @property
-    def diarization_url(self) -> str:
-        """Get the diarization API URL."""
-        return f"http://{self.server_host}:{self.diarization_port}"
-
-    @property
-    def translation_url(self) -> str:
-        """Get the translation API URL."""
-        return f"http://{self.server_host}:{self.translation_port}"
-
-    @property
-    def tts_url(self) -> str:
-        """Get the TTS API URL."""
-        return f"http://{self.server_host}:{self.tts_port}"
+
+# Names accepted by Config(); derived attributes (init=False) are excluded
+_FIELD_NAMES = frozenset(f.name for f in fields(Config) if f.init)
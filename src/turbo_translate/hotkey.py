@@ -1,13 +1,53 @@
 """Global hotkey handling."""
 
+import functools
 import os
 import platform
 import threading
-from typing import Callable
-
-
+import time
+from typing import Any, Callable
+
+try:
+    from pynput import keyboard
+except ImportError:  # pynput backends fail to import without a usable display server
+    keyboard = None
+
+# Hotkey string names to pynput keys
+_KEY_MAP: dict[str, Any] = {}
+if keyboard is not None:
+    _KEY_MAP = {
+        "alt": keyboard.Key.alt,
+        "ctrl": keyboard.Key.ctrl,
+        "control": keyboard.Key.ctrl,
+        "shift": keyboard.Key.shift,
+        "space": keyboard.Key.space,
+        "enter": keyboard.Key.enter,
+        "tab": keyboard.Key.tab,
+        "esc": keyboard.Key.esc,
+        "escape": keyboard.Key.esc,
+    }
+    # Add function keys
+    for _i in range(1, 13):
+        _KEY_MAP[f"f{_i}"] = getattr(keyboard.Key, f"f{_i}")
+
+# Minimum time between hotkey triggers
+_DEBOUNCE_NS = 300_000_000
+
+# Bit assigned to each key used in a hotkey, so combos can be matched with a mask
+_KEY_BITS: dict[Any, int] = {}
+
+
+def _key_bit(key: Any) -> int:
+    """Get the bit for a key, assigning the next free one on first use."""
+    bit = _KEY_BITS.get(key)
+    if bit is None:
+        bit = _KEY_BITS[key] = 1 << len(_KEY_BITS)
+    return bit
+
+
+@functools.cache
 def is_wayland() -> bool:
-    """Check if running on Wayland."""
+    """Check if running on Wayland (cached; the session type cannot change)."""
     session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
     wayland_display = os.environ.get("WAYLAND_DISPLAY", "")
     return session_type == "wayland" or bool(wayland_display)
@@ -27,65 +67,61 @@ class HotkeyManager:
         self.hotkey = hotkey
         self.callback = callback
         self._listener = None
-        self._pressed_keys: set = set()
-        self._hotkey_keys: set = set()
-        self._last_trigger = 0.0
+        self._pressed_mask = 0
+        self._hotkey_keys: frozenset = frozenset()
+        self._hotkey_mask = 0
+        self._last_trigger_ns = 0
 
         self._parse_hotkey()
 
     def _parse_hotkey(self):
         """Parse hotkey string into key set."""
-        from pynput import keyboard
-
-        key_map = {
-            "alt": keyboard.Key.alt,
-            "ctrl": keyboard.Key.ctrl,
-            "control": keyboard.Key.ctrl,
-            "shift": keyboard.Key.shift,
-            "space": keyboard.Key.space,
-            "enter": keyboard.Key.enter,
-            "tab": keyboard.Key.tab,
-            "esc": keyboard.Key.esc,
-            "escape": keyboard.Key.esc,
-        }
-
-        # Add function keys
-        for i in range(1, 13):
-            key_map[f"f{i}"] = getattr(keyboard.Key, f"f{i}")
-
-        self._hotkey_keys = set()
+        if keyboard is None:
+            return
+
+        hotkey_keys = set()
         for part in self.hotkey.lower().split("+"):
             part = part.strip()
-            if part in key_map:
-                self._hotkey_keys.add(key_map[part])
+            if part in _KEY_MAP:
+                hotkey_keys.add(_KEY_MAP[part])
             elif len(part) == 1:
-                self._hotkey_keys.add(keyboard.KeyCode.from_char(part))
+                hotkey_keys.add(keyboard.KeyCode.from_char(part))
+        self._hotkey_keys = frozenset(hotkey_keys)
+
+        self._hotkey_mask = 0
+        for key in self._hotkey_keys:
+            self._hotkey_mask |= _key_bit(key)
 
     def start(self):
         """Start listening for hotkey."""
-        from pynput import keyboard
+        if keyboard is None:
+            print("pynput is unavailable; global hotkey disabled")
+            return
 
         def on_press(key):
             # Normalize key
             if hasattr(key, "value"):
                 key = key.value
-            self._pressed_keys.add(key)
+            bit = _KEY_BITS.get(key, 0)
+            self._pressed_mask |= bit
 
-            # Check if hotkey is pressed
-            if self._hotkey_keys.issubset(self._pressed_keys):
-                import time
+            # Most keystrokes are not part of the hotkey
+            if not bit & self._hotkey_mask:
+                return
 
-                now = time.time()
+            # Check if hotkey is pressed
+            if self._pressed_mask & self._hotkey_mask == self._hotkey_mask:
+                now = time.monotonic_ns()
                 # Debounce
-                if now - self._last_trigger > 0.3:
-                    self._last_trigger = now
+                if now - self._last_trigger_ns > _DEBOUNCE_NS:
+                    self._last_trigger_ns = now
                     self.callback()
 
         def on_release(key):
             # Normalize key
             if hasattr(key, "value"):
                 key = key.value
-            self._pressed_keys.discard(key)
+            self._pressed_mask &= ~_KEY_BITS.get(key, 0)
 
         self._listener = keyboard.Listener(on_press=on_press, on_release=on_release)
         self._listener.start()
@@ -1,14 +1,26 @@
 """SVG icons for the application."""
 
+from functools import lru_cache
+
 from PyQt6.QtCore import QByteArray, QSize
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 
 
+def _make_template(svg_data: str) -> str:
+    """Turn currentColor attributes into a {color} format placeholder."""
+    escaped = svg_data.replace("{", "{{").replace("}", "}}")
+    return escaped.replace('"currentColor"', '"{color}"')
+
+
+@lru_cache(maxsize=128)
 def _svg_to_icon(svg_data: str, color: str = "#888888", size: int = 20) -> QIcon:
-    """Convert SVG string to QIcon with color replacement."""
-    svg_data = svg_data.replace('stroke="currentColor"', f'stroke="{color}"')
-    svg_data = svg_data.replace('fill="currentColor"', f'fill="{color}"')
+    """Convert SVG string to QIcon with color replacement.
+
+    Results are cached, so each (svg, color, size) is rendered only once.
+    """
+    template = _TEMPLATES.get(svg_data) or _make_template(svg_data)
+    svg_data = template.format(color=color)
 
     renderer = QSvgRenderer(QByteArray(svg_data.encode()))
     pixmap = QPixmap(QSize(size, size))
@@ -50,6 +62,31 @@ ICON_CHEVRON_DOWN = '''<svg xmlns="http://www.w3.org/2000/svg" width="24" height
 
 ICON_CHEVRON_UP = '''<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="m18 15-6-6-6 6"></path></svg>'''
 
+# Color templates for each ICON_* constant, keyed by the original SVG string
+_TEMPLATES = {
+    value: _make_template(value) for name, value in globals().items() if name.startswith("ICON_")
+}
+
+
+def preload_icons(colors: list[str], sizes: list[int]) -> None:
+    """
+    Render every ICON_* SVG up front so later lookups hit the cache.
+
+    Must be called after the QApplication has been created.
+
+    Args:
+        colors: Colors the UI uses for icons
+        sizes: Icon sizes in pixels
+    """
+    svgs = [value for name, value in globals().items() if name.startswith("ICON_")]
+    for svg_data in svgs:
+        for color in colors:
+            for size in sizes:
+                _svg_to_icon(svg_data, color, size)
+
+    for listening in (False, True):
+        get_tray_icon(listening)
+
 
 def get_settings_icon(color: str = "#888888", size: int = 20) -> QIcon:
     return _svg_to_icon(ICON_SETTINGS, color, size)
@@ -99,8 +136,9 @@ def get_chevron_up_icon(color: str = "#888888", size: int = 20) -> QIcon:
     return _svg_to_icon(ICON_CHEVRON_UP, color, size)
 
 
+@lru_cache(maxsize=4)
 def get_tray_icon(listening: bool = False, size: int = 64) -> QIcon:
-    """Generate system tray icon - blue orb."""
+    """Generate system tray icon - blue orb (cached per state and size)."""
     from PyQt6.QtCore import Qt
     from PyQt6.QtGui import QPainter, QRadialGradient, QBrush, QImage
 
@@ -1,11 +1,16 @@
 """Main application entry point."""
 
+import queue
 import sys
-import threading
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+from functools import partial
 from typing import Optional
 
-from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QFont
+import httpx
+from PyQt6.QtCore import QObject, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QColor, QFont
 from PyQt6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -32,20 +37,61 @@ from .api import APIError, TranslationPipeline
 from .audio_player import AudioPlayer
 from .config import Config
 from .hotkey import create_hotkey_manager
-from .icons import get_settings_icon, get_tray_icon
-from .recorder import AudioRecorder
-from .transcript_panel import StatusBar, TranscriptPanel
+from .icons import get_settings_icon, get_tray_icon, preload_icons
+from .recorder import WAV_HEADER_SIZE, AudioRecorder
+from .styles import APP_QSS
+from .transcript_panel import ColorDot, StatusBar, TranscriptPanel
 from .waveform import WaveformWidget
 
+# Speaker row name field; formatted with the speaker's color
+_SPEAKER_NAME_QSS = (
+    "QLineEdit {{ background: transparent; color: {color}; border: none;"
+    " font-size: 12px; padding: 0; }}"
+    "QLineEdit:focus {{ background: #1e293b; border: 1px solid {color};"
+    " border-radius: 3px; padding: 2px; }}"
+)
+
+# Segments waiting for transcription beyond this are dropped, oldest first
+_MAX_PENDING_SEGMENTS = 4
+
+# Display names for the language selectors; the combos store the code as item data
+_LANGUAGE_NAMES = {
+    "hu": "Hungarian (hu)",
+    "en": "English (en)",
+    "de": "German (de)",
+    "es": "Spanish (es)",
+}
+
+# Reading prompts in different languages, formatted with the speaker's name
+_ENROLL_PROMPTS = {
+    "HU": "Szia, a nevem {name}. Ma szép idő van, és örülök, hogy itt lehetek veletek.",
+    "EN": "Hello, my name is {name}. The weather is nice today, and I'm happy to be here with you.",
+    "DE": (
+        "Hallo, mein Name ist {name}. Das Wetter ist heute schön, "
+        "und ich freue mich, hier zu sein."
+    ),
+    "ES": "Hola, me llamo {name}. El tiempo está bonito hoy, y estoy feliz de estar aquí.",
+}
+
 
 class SignalBridge(QObject):
-    """Thread-safe signal emitter."""
+    """
+    Thread-safe signal emitter.
+
+    Signals are emitted from recorder and pool worker threads and always connected
+    with queued connections, so slots run on the GUI thread and emitters never block.
+    Emitters must not take locks the GUI thread holds.
+    """
 
-    level_changed = pyqtSignal(float)
-    segment_ready = pyqtSignal(bytes)
-    transcription_done = pyqtSignal(list)
+    segment_ready = pyqtSignal(object)  # WAV bytes, passed by reference
+    results_available = pyqtSignal()  # (spoken_at, results) waiting in MainWindow._result_q
     error_occurred = pyqtSignal(str)
     status_changed = pyqtSignal(str)
+    speakers_fetched = pyqtSignal(list)
+    pipeline_ready = pyqtSignal(object)
+    speaker_status = pyqtSignal(str, str)
+    transcript_entry = pyqtSignal(dict)  # Keyword arguments for TranscriptPanel.add_entry()
+    enrollment_finished = pyqtSignal(bool, bool)  # enrolled, was_listening
 
 
 class MainWindow(QMainWindow):
@@ -62,15 +108,38 @@ class MainWindow(QMainWindow):
         self.player: Optional[AudioPlayer] = None
         self.hotkey_manager = None
 
+        # Shared connection to the diarization service for speaker management
+        self.http = self._create_http_client()
+
         # State
         self._listening = False
-        self._processing = False
+        self._settings_dialog = None
+
+        # Streamed-upload results for captured segments, in the order they were emitted
+        self._segment_caches: deque[Future] = deque()
+
+        # Segments waiting for transcription, oldest first, as (wav, cache, spoken_at).
+        # Appended on the GUI thread and taken by transcribe_pool workers; deque append
+        # and popleft are atomic, so no lock is needed.
+        self._pending_segments: deque[tuple[bytes, Optional[Future], datetime]] = deque()
 
+        # Transcription results handed over by workers, drained on the GUI thread
+        self._result_q: queue.SimpleQueue[tuple[datetime, list]] = queue.SimpleQueue()
+
+        preload_icons(["#94a3b8"], [20])
         self._setup_ui()
         self._setup_connections()
+        self._refresh_speakers_list()
         self._setup_tray()
         self._init_components()
 
+        # Import the settings dialog once the event loop is idle, not on first click
+        QTimer.singleShot(0, self._preload_settings_dialog)
+
+    def _preload_settings_dialog(self):
+        """Import the settings dialog module ahead of its first use."""
+        from . import settings_dialog  # noqa: F401
+
     def _setup_ui(self):
         """Set up the main window UI."""
         self.setWindowTitle("Turbo Translate")
@@ -88,7 +157,7 @@ class MainWindow(QMainWindow):
         # Left panel - Waveform and controls
         left_panel = QWidget()
         left_panel.setFixedWidth(250)
-        left_panel.setStyleSheet("background-color: #0f172a;")
+        left_panel.setObjectName("leftPanel")
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(16, 16, 16, 16)
         left_layout.setSpacing(16)
@@ -106,77 +175,53 @@ class MainWindow(QMainWindow):
         # Listen button
         self.listen_btn = QPushButton("Start Listening")
         self.listen_btn.setFixedHeight(40)
-        self.listen_btn.setStyleSheet(
-            "QPushButton {"
-            "  background-color: #3b82f6;"
-            "  color: white;"
-            "  border: none;"
-            "  border-radius: 8px;"
-            "  font-size: 14px;"
-            "  font-weight: bold;"
-            "}"
-            "QPushButton:hover {"
-            "  background-color: #2563eb;"
-            "}"
-            "QPushButton:pressed {"
-            "  background-color: #1d4ed8;"
-            "}"
-        )
+        self.listen_btn.setObjectName("listenBtn")
         self.listen_btn.clicked.connect(self._toggle_listening)
         left_layout.addWidget(self.listen_btn)
 
         # Language selector
         lang_group = QGroupBox("Languages")
-        lang_group.setStyleSheet(
-            "QGroupBox {"
-            "  color: #e2e8f0;"
-            "  font-weight: bold;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 8px;"
-            "  margin-top: 8px;"
-            "  padding-top: 8px;"
-            "}"
-            "QGroupBox::title {"
-            "  subcontrol-origin: margin;"
-            "  left: 8px;"
-            "}"
-        )
         lang_layout = QGridLayout(lang_group)
 
         lang_layout.addWidget(QLabel("Source:"), 0, 0)
         self.source_lang = QComboBox()
-        self.source_lang.addItems(["Hungarian (hu)", "English (en)", "German (de)", "Spanish (es)"])
-        self.source_lang.setCurrentText("Hungarian (hu)")
-        self.source_lang.setStyleSheet(self._combo_style())
+        for code in ("hu", "en", "de", "es"):
+            self.source_lang.addItem(_LANGUAGE_NAMES[code], code)
+        self.source_lang.setCurrentIndex(self.source_lang.findData("hu"))
         lang_layout.addWidget(self.source_lang, 0, 1)
 
         lang_layout.addWidget(QLabel("Target:"), 1, 0)
         self.target_lang = QComboBox()
-        self.target_lang.addItems(["English (en)", "Hungarian (hu)", "German (de)", "Spanish (es)"])
-        self.target_lang.setCurrentText("English (en)")
-        self.target_lang.setStyleSheet(self._combo_style())
+        for code in ("en", "hu", "de", "es"):
+            self.target_lang.addItem(_LANGUAGE_NAMES[code], code)
+        self.target_lang.setCurrentIndex(self.target_lang.findData("en"))
         lang_layout.addWidget(self.target_lang, 1, 1)
 
         # Style labels
         for label in lang_group.findChildren(QLabel):
-            label.setStyleSheet("color: #94a3b8; font-size: 12px;")
+            label.setObjectName("sectionLabel")
 
         left_layout.addWidget(lang_group)
 
         # Microphone selector
         mic_label = QLabel("Microphone")
-        mic_label.setStyleSheet("color: #94a3b8; font-size: 12px;")
+        mic_label.setObjectName("sectionLabel")
         left_layout.addWidget(mic_label)
 
         self.mic_combo = QComboBox()
-        self.mic_combo.setStyleSheet(self._combo_style())
         self._populate_mic_dropdown()
         self.mic_combo.currentIndexChanged.connect(self._on_mic_changed)
+
+        # Reopen the audio stream only once the selection settles
+        self._mic_change_timer = QTimer(self)
+        self._mic_change_timer.setSingleShot(True)
+        self._mic_change_timer.setInterval(250)
+        self._mic_change_timer.timeout.connect(self._apply_mic_change)
         left_layout.addWidget(self.mic_combo)
 
         # Speakers section
         speakers_label = QLabel("Speakers")
-        speakers_label.setStyleSheet("color: #94a3b8; font-size: 12px;")
+        speakers_label.setObjectName("sectionLabel")
         left_layout.addWidget(speakers_label)
 
         # Container for speaker list
@@ -185,7 +230,12 @@ class MainWindow(QMainWindow):
         self.speakers_layout.setContentsMargins(0, 0, 0, 0)
         self.speakers_layout.setSpacing(4)
         left_layout.addWidget(self.speakers_container)
-        self._refresh_speakers_list()
+
+        # Speaker rows by speaker ID: (row, name_edit, dot, color); kept after the rows
+        self._speaker_rows: dict[str, tuple[QWidget, QLineEdit, ColorDot, str]] = {}
+        self._speakers_empty_label = QLabel("No speakers enrolled")
+        self._speakers_empty_label.setObjectName("speakersEmpty")
+        self.speakers_layout.addWidget(self._speakers_empty_label)
 
         # Inline enrollment - name and language row
         enroll_row1 = QHBoxLayout()
@@ -193,23 +243,11 @@ class MainWindow(QMainWindow):
 
         self.enroll_name_input = QLineEdit()
         self.enroll_name_input.setPlaceholderText("Name...")
-        self.enroll_name_input.setStyleSheet(
-            "QLineEdit {"
-            "  background-color: #1e293b;"
-            "  color: #e2e8f0;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 4px;"
-            "  padding: 6px;"
-            "}"
-            "QLineEdit:focus {"
-            "  border-color: #3b82f6;"
-            "}"
-        )
+        self.enroll_name_input.setObjectName("enrollName")
 
         self.enroll_lang_combo = QComboBox()
         self.enroll_lang_combo.addItems(["HU", "EN", "DE", "ES"])
         self.enroll_lang_combo.setFixedWidth(55)
-        self.enroll_lang_combo.setStyleSheet(self._combo_style())
 
         enroll_row1.addWidget(self.enroll_name_input)
         enroll_row1.addWidget(self.enroll_lang_combo)
@@ -217,24 +255,7 @@ class MainWindow(QMainWindow):
 
         # Enroll button
         self.enroll_btn = QPushButton("🎤 Enroll Voice")
-        self.enroll_btn.setStyleSheet(
-            "QPushButton {"
-            "  background-color: #1e293b;"
-            "  color: #94a3b8;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 6px;"
-            "  padding: 8px;"
-            "}"
-            "QPushButton:hover {"
-            "  background-color: #334155;"
-            "  color: #e2e8f0;"
-            "}"
-            "QPushButton:disabled {"
-            "  background-color: #ef4444;"
-            "  color: white;"
-            "  border-color: #ef4444;"
-            "}"
-        )
+        self.enroll_btn.setObjectName("enrollBtn")
         self.enroll_btn.clicked.connect(self._start_enrollment)
         left_layout.addWidget(self.enroll_btn)
 
@@ -242,20 +263,7 @@ class MainWindow(QMainWindow):
         self.tts_btn = QPushButton("TTS: ON")
         self.tts_btn.setCheckable(True)
         self.tts_btn.setChecked(self.config.tts_enabled)
-        self.tts_btn.setStyleSheet(
-            "QPushButton {"
-            "  background-color: #1e293b;"
-            "  color: #94a3b8;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 6px;"
-            "  padding: 8px;"
-            "}"
-            "QPushButton:checked {"
-            "  background-color: #22c55e;"
-            "  color: white;"
-            "  border-color: #22c55e;"
-            "}"
-        )
+        self.tts_btn.setObjectName("ttsBtn")
         self.tts_btn.clicked.connect(self._toggle_tts)
         left_layout.addWidget(self.tts_btn)
 
@@ -264,18 +272,7 @@ class MainWindow(QMainWindow):
         # Settings button
         settings_btn = QPushButton("Settings")
         settings_btn.setIcon(get_settings_icon("#94a3b8"))
-        settings_btn.setStyleSheet(
-            "QPushButton {"
-            "  background-color: transparent;"
-            "  color: #94a3b8;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 6px;"
-            "  padding: 8px;"
-            "}"
-            "QPushButton:hover {"
-            "  background-color: #1e293b;"
-            "}"
-        )
+        settings_btn.setObjectName("settingsBtn")
         settings_btn.clicked.connect(self._show_settings)
         left_layout.addWidget(settings_btn)
 
@@ -283,7 +280,7 @@ class MainWindow(QMainWindow):
 
         # Right panel - Transcript
         right_panel = QWidget()
-        right_panel.setStyleSheet("background-color: #0f172a;")
+        right_panel.setObjectName("rightPanel")
         right_layout = QVBoxLayout(right_panel)
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.setSpacing(0)
@@ -302,50 +299,12 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(right_panel)
 
-        # Apply dark theme
-        self.setStyleSheet(
-            "QMainWindow {"
-            "  background-color: #0f172a;"
-            "}"
-            "QLabel {"
-            "  color: #e2e8f0;"
-            "}"
-        )
-
-    def _combo_style(self) -> str:
-        """Get combo box style."""
-        return (
-            "QComboBox {"
-            "  background-color: #1e293b;"
-            "  color: #e2e8f0;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 4px;"
-            "  padding: 4px 8px;"
-            "}"
-            "QComboBox:hover {"
-            "  border-color: #3b82f6;"
-            "}"
-            "QComboBox::drop-down {"
-            "  border: none;"
-            "}"
-            "QComboBox QAbstractItemView {"
-            "  background-color: #1e293b;"
-            "  color: #e2e8f0;"
-            "  selection-background-color: #3b82f6;"
-            "}"
-        )
-
     def _populate_mic_dropdown(self):
         """Populate dropdown with available audio devices."""
         self.mic_combo.clear()
         self.mic_combo.addItem("System Default", None)
 
-        # Get devices from recorder
-        temp_recorder = AudioRecorder()
-        devices = temp_recorder.get_devices()
-        temp_recorder.cleanup()
-
-        for dev in devices:
+        for dev in AudioRecorder.list_devices():
             idx = dev["index"]
             name = dev.get("description", dev["name"])
             rate = dev.get("sample_rate", 48000)
@@ -360,9 +319,13 @@ class MainWindow(QMainWindow):
 
     def _on_mic_changed(self, index: int):
         """Handle microphone selection change."""
-        device_index = self.mic_combo.currentData()
-        self.config.input_device_index = device_index
+        self.config.input_device_index = self.mic_combo.currentData()
         self.config.input_device_name = self.mic_combo.currentText()
+        self._mic_change_timer.start()
+
+    def _apply_mic_change(self):
+        """Switch the recorder to the selected microphone."""
+        device_index = self.mic_combo.currentData()
 
         # Restart recorder if listening
         if self._listening:
@@ -378,107 +341,163 @@ class MainWindow(QMainWindow):
             )
             self._start_listening()
 
+    def _create_http_client(self) -> httpx.Client:
+        """Create the keep-alive HTTP client for speaker management requests."""
+        return httpx.Client(base_url=self.config.diarization_url, timeout=5.0)
+
     def _refresh_speakers_list(self):
-        """Refresh the enrolled speakers list."""
-        # Clear existing items
-        while self.speakers_layout.count():
-            item = self.speakers_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Try to get speakers from diarization service
-        speakers = []
-        try:
-            import httpx
-            url = f"{self.config.diarization_url}/speakers"
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(url)
+        """Refresh the enrolled speakers list.
+
+        The request runs on a worker thread; the list is rebuilt in
+        _render_speakers once the speakers_fetched signal arrives.
+        """
+        http = self.http
+
+        def fetch():
+            # Try to get speakers from diarization service
+            speakers = []
+            try:
+                response = http.get("/speakers")
                 if response.status_code == 200:
                     data = response.json()
                     speakers = data.get("speakers", [])
-        except Exception:
-            pass
+            except Exception:
+                pass
+            self.signals.speakers_fetched.emit(speakers)
 
-        if not speakers:
-            empty_label = QLabel("No speakers enrolled")
-            empty_label.setStyleSheet("color: #64748b; font-size: 11px; font-style: italic;")
-            self.speakers_layout.addWidget(empty_label)
-            return
+        QThreadPool.globalInstance().start(fetch)
+
+    def _render_speakers(self, speakers: list):
+        """Update the speaker rows in place from a fetched speaker list."""
+        # Remove rows for speakers that no longer exist
+        speaker_ids = {sp.get("speaker_id") for sp in speakers}
+        for speaker_id in set(self._speaker_rows) - speaker_ids:
+            row = self._speaker_rows.pop(speaker_id)[0]
+            self.speakers_layout.removeWidget(row)
+            row.deleteLater()
 
-        # Create a row for each speaker
+        self._speakers_empty_label.setVisible(not speakers)
+
+        # Add new rows and update existing ones, keeping the service's order
         for i, sp in enumerate(speakers):
             name = sp.get("name", "Unknown")
             speaker_id = sp.get("speaker_id")
             color = self.config.speaker_colors[i % len(self.config.speaker_colors)]
 
-            row = QWidget()
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(0, 2, 0, 2)
-            row_layout.setSpacing(6)
-
-            # Color dot
-            dot = QLabel()
-            dot.setFixedSize(10, 10)
-            dot.setStyleSheet(f"background-color: {color}; border-radius: 5px;")
-            row_layout.addWidget(dot)
-
-            # Editable name field
-            name_edit = QLineEdit(name)
-            name_edit.setStyleSheet(
-                f"QLineEdit {{ background: transparent; color: {color}; border: none; font-size: 12px; padding: 0; }}"
-                f"QLineEdit:focus {{ background: #1e293b; border: 1px solid {color}; border-radius: 3px; padding: 2px; }}"
-            )
-            name_edit.editingFinished.connect(
-                lambda edit=name_edit, sid=speaker_id: self._rename_speaker(sid, edit.text())
-            )
-            row_layout.addWidget(name_edit)
-            row_layout.addStretch()
-
-            # Delete button
-            del_btn = QPushButton("×")
-            del_btn.setFixedSize(18, 18)
-            del_btn.setStyleSheet(
-                "QPushButton { background: transparent; color: #64748b; border: none; font-size: 14px; }"
-                "QPushButton:hover { color: #ef4444; }"
-            )
-            del_btn.clicked.connect(lambda checked, sid=speaker_id, sname=name: self._delete_speaker(sid, sname))
-            row_layout.addWidget(del_btn)
-
-            self.speakers_layout.addWidget(row)
+            entry = self._speaker_rows.get(speaker_id)
+            if entry is None:
+                entry = self._create_speaker_row(speaker_id, name, color)
+                self._speaker_rows[speaker_id] = entry
+            else:
+                row, name_edit, dot, old_color = entry
+                if name_edit.text() != name and not name_edit.hasFocus():
+                    name_edit.setText(name)
+                if color != old_color:
+                    dot.set_color(QColor(color))
+                    name_edit.setStyleSheet(_SPEAKER_NAME_QSS.format(color=color))
+                    self._speaker_rows[speaker_id] = (row, name_edit, dot, color)
+
+            row = entry[0]
+            if self.speakers_layout.indexOf(row) != i:
+                self.speakers_layout.removeWidget(row)
+                self.speakers_layout.insertWidget(i, row)
+
+    def _create_speaker_row(
+        self, speaker_id: str, name: str, color: str
+    ) -> tuple[QWidget, QLineEdit, ColorDot, str]:
+        """Build the widgets for one speaker row."""
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 2, 0, 2)
+        row_layout.setSpacing(6)
+
+        # Color dot
+        dot = ColorDot(QColor(color), 10)
+        row_layout.addWidget(dot)
+
+        # Editable name field
+        name_edit = QLineEdit(name)
+        name_edit.setStyleSheet(_SPEAKER_NAME_QSS.format(color=color))
+        name_edit.editingFinished.connect(partial(self._rename_from_edit, speaker_id, name_edit))
+        row_layout.addWidget(name_edit)
+        row_layout.addStretch()
+
+        # Delete button
+        del_btn = QPushButton("×")
+        del_btn.setFixedSize(18, 18)
+        del_btn.setObjectName("speakerDelete")
+        del_btn.clicked.connect(partial(self._on_delete_clicked, speaker_id))
+        row_layout.addWidget(del_btn)
+
+        return row, name_edit, dot, color
+
+    def _rename_from_edit(self, speaker_id: str, name_edit: QLineEdit):
+        """Rename a speaker to the text of its row's name field."""
+        self._rename_speaker(speaker_id, name_edit.text())
+
+    def _on_delete_clicked(self, speaker_id: str, checked: bool = False):
+        """Delete the speaker whose row's delete button was clicked."""
+        entry = self._speaker_rows.get(speaker_id)
+        if entry is not None:
+            self._delete_speaker(speaker_id, entry[1].text())
 
     def _delete_speaker(self, speaker_id: str, speaker_name: str):
         """Delete a speaker."""
-        try:
-            import httpx
-            url = f"{self.config.diarization_url}/speakers/{speaker_id}"
-            with httpx.Client(timeout=5.0) as client:
-                response = client.delete(url)
+        http = self.http
+
+        def delete():
+            try:
+                response = http.delete(f"/speakers/{speaker_id}")
                 if response.status_code == 200:
                     self._refresh_speakers_list()
-        except Exception:
-            self.status_bar.set_status(f"✗ Delete failed", "#ef4444")
+            except Exception:
+                self.signals.speaker_status.emit("✗ Delete failed", "#ef4444")
+
+        QThreadPool.globalInstance().start(delete)
 
     def _rename_speaker(self, speaker_id: str, new_name: str):
         """Rename a speaker."""
         if not new_name.strip():
             return
-        try:
-            import httpx
-            url = f"{self.config.diarization_url}/speakers/{speaker_id}"
-            with httpx.Client(timeout=5.0) as client:
-                response = client.patch(url, json={"name": new_name.strip()})
+        http = self.http
+
+        def rename():
+            try:
+                response = http.patch(f"/speakers/{speaker_id}", json={"name": new_name.strip()})
                 if response.status_code == 200:
-                    self.status_bar.set_status(f"✓ Renamed to {new_name}", "#22c55e")
-                    QTimer.singleShot(2000, lambda: self.status_bar.set_listening(self._listening))
-        except Exception:
-            pass  # Silently fail - name stays as typed
+                    self.signals.speaker_status.emit(f"✓ Renamed to {new_name}", "#22c55e")
+            except Exception:
+                pass  # Silently fail - name stays as typed
+
+        QThreadPool.globalInstance().start(rename)
+
+    def _on_speaker_status(self, message: str, color: str):
+        """Show the outcome of a speaker request, then restore the listening status."""
+        self.status_bar.set_status(message, color)
+        QTimer.singleShot(2000, lambda: self.status_bar.set_listening(self._listening))
+
+    def _on_transcript_entry(self, entry: dict):
+        """Add a transcript entry sent by a worker thread."""
+        self.transcript.add_entry(**entry)
 
     def _setup_connections(self):
         """Set up signal connections."""
-        self.signals.level_changed.connect(self._on_level_changed)
-        self.signals.segment_ready.connect(self._on_segment_ready)
-        self.signals.transcription_done.connect(self._on_transcription_done)
-        self.signals.error_occurred.connect(self._on_error)
+        # Queued explicitly: the emitters are worker threads and must never run slots inline
+        queued = Qt.ConnectionType.QueuedConnection
+        self.signals.segment_ready.connect(self._on_segment_ready, queued)
+        self.signals.results_available.connect(self._drain_results, queued)
+        self.signals.error_occurred.connect(self._on_error, queued)
+        self.signals.speakers_fetched.connect(self._render_speakers, queued)
+        self.signals.pipeline_ready.connect(self._on_pipeline_ready, queued)
+        self.signals.speaker_status.connect(self._on_speaker_status, queued)
+        self.signals.transcript_entry.connect(self._on_transcript_entry, queued)
+        self.signals.enrollment_finished.connect(self._on_enrollment_finished, queued)
+
+        # Poll the recorder's latest audio level at ~30 Hz rather than signalling per chunk
+        self._level_timer = QTimer(self)
+        self._level_timer.setInterval(33)
+        self._level_timer.timeout.connect(self._poll_level)
+        self._shown_level = 0.0
 
     def _setup_tray(self):
         """Set up system tray icon."""
@@ -519,18 +538,44 @@ class MainWindow(QMainWindow):
             voice_timeout=self.config.voice_activity_timeout,
         )
 
-        # Pipeline
-        self.pipeline = TranslationPipeline(self.config)
+        # Pipeline, created off the GUI thread; listening is enabled once it is ready
+        self.pipeline = None
+        self.listen_btn.setEnabled(False)
+        self.enroll_btn.setEnabled(False)
+        config = self.config
+        QThreadPool.globalInstance().start(
+            lambda: self.signals.pipeline_ready.emit(TranslationPipeline(config))
+        )
 
         # Audio player
         self.player = AudioPlayer()
 
+        # Worker pools: segments are processed one at a time, in order. Workers never
+        # expire, so they are created once rather than after every idle pause.
+        self.transcribe_pool = QThreadPool(self)
+        self.transcribe_pool.setMaxThreadCount(1)
+        self.transcribe_pool.setExpiryTimeout(-1)
+        # One TTS thread, so translations are spoken in the order they arrive
+        self.tts_pool = QThreadPool(self)
+        self.tts_pool.setMaxThreadCount(1)
+        self.tts_pool.setExpiryTimeout(-1)
+
         # Hotkey
         self.hotkey_manager = create_hotkey_manager(
             self.config.hotkey, self._toggle_listening
         )
         self.hotkey_manager.start()
 
+    def _on_pipeline_ready(self, pipeline: TranslationPipeline):
+        """Install the pipeline built in the background and enable listening."""
+        if self.pipeline is not None:
+            # Settings replaced it while this one was being built
+            pipeline.close()
+            return
+        self.pipeline = pipeline
+        self.listen_btn.setEnabled(True)
+        self.enroll_btn.setEnabled(True)
+
     def _update_icons(self, listening: bool):
         """Update tray and window icons based on listening state."""
         icon = get_tray_icon(listening)
@@ -546,7 +591,7 @@ class MainWindow(QMainWindow):
 
     def _start_listening(self):
         """Start listening for speech."""
-        if self._listening:
+        if self._listening or self.pipeline is None:
             return
 
         self._listening = True
@@ -556,17 +601,18 @@ class MainWindow(QMainWindow):
         self._update_icons(True)
 
         # Update language settings
-        source = self.source_lang.currentText().split("(")[-1].rstrip(")")
-        target = self.target_lang.currentText().split("(")[-1].rstrip(")")
+        source = self.source_lang.currentData() or "hu"
+        target = self.target_lang.currentData() or "en"
         self.config.source_language = source
         self.config.target_language = target
         self.status_bar.set_languages(source, target)
 
         # Start recording
         self.recorder.start_continuous(
-            level_callback=lambda level: self.signals.level_changed.emit(level),
-            segment_callback=lambda data: self.signals.segment_ready.emit(data),
+            segment_callback=self._on_segment_captured,
+            chunk_callback=self._on_audio_chunk,
         )
+        self._level_timer.start()
 
     def _stop_listening(self):
         """Stop listening."""
@@ -580,39 +626,86 @@ class MainWindow(QMainWindow):
         self._update_icons(False)
 
         self.recorder.stop()
+        self._level_timer.stop()
+        self._on_level_changed(0.0)
+
+    def _poll_level(self):
+        """Show the recorder's latest audio level if it changed since the last poll."""
+        level = self.recorder.get_level()
+        if level != self._shown_level:
+            self._on_level_changed(level)
+        self.waveform.set_samples(self.recorder.get_recent_samples(512))
 
     def _on_level_changed(self, level: float):
         """Handle audio level change."""
+        self._shown_level = level
         self.waveform.set_level(level)
 
+    def _on_audio_chunk(self, data: bytes, segment_start: bool):
+        """Stream audio to the diarization service while speech is recorded (audio thread)."""
+        if segment_start:
+            self.pipeline.open_stream(self.config.sample_rate, self.config.channels)
+        self.pipeline.push_chunk(data)
+
+    def _on_segment_captured(self, wav_data: bytes):
+        """Finish the streamed upload and hand the segment to the GUI thread (audio thread)."""
+        self._segment_caches.append(self.pipeline.close_stream(len(wav_data) - WAV_HEADER_SIZE))
+        self.signals.segment_ready.emit(wav_data)
+
     def _on_segment_ready(self, audio_data: bytes):
         """Handle speech segment ready for processing."""
-        if self._processing:
-            return
-
-        self._processing = True
+        cache_future = self._segment_caches.popleft() if self._segment_caches else None
+        # The segment arrives as the speaker stops, so this is when its text was spoken
+        spoken_at = datetime.now()
         self.waveform.set_processing(True)
         self.status_bar.set_processing(True)
 
-        # Process in background thread
-        def process():
+        # Queue behind the segment being transcribed; under sustained load drop the
+        # oldest segment that has not started yet rather than growing without bound
+        if len(self._pending_segments) >= _MAX_PENDING_SEGMENTS:
             try:
-                results = self.pipeline.process_audio(
-                    audio_data, self.config.source_language
-                )
-                self.signals.transcription_done.emit(results)
-            except APIError as e:
-                self.signals.error_occurred.emit(str(e))
-            finally:
-                self._processing = False
-                self.waveform.set_processing(False)
+                self._pending_segments.popleft()
+            except IndexError:
+                pass  # A worker took it in the meantime
+            else:
+                self.status_bar.set_status("Busy: skipped a queued segment", "#f59e0b")
+        self._pending_segments.append((audio_data, cache_future, spoken_at))
+
+        # One call per segment; transcribe_pool runs them one at a time, and a call whose
+        # segment was dropped finds the queue empty and returns
+        self.transcribe_pool.start(self._transcribe_next_segment)
 
-        threading.Thread(target=process, daemon=True).start()
+    def _transcribe_next_segment(self):
+        """Transcribe the oldest queued segment, if any (runs on a transcribe_pool worker)."""
+        try:
+            audio_data, cache_future, spoken_at = self._pending_segments.popleft()
+        except IndexError:
+            return
+        try:
+            results = self.pipeline.process_audio(
+                audio_data, self.config.source_language, cache_future
+            )
+            self._result_q.put((spoken_at, results))
+            self.signals.results_available.emit()
+        except APIError as e:
+            self.signals.error_occurred.emit(str(e))
+        finally:
+            self.waveform.set_processing(False)
+
+    def _drain_results(self):
+        """Render every transcription result list queued by the workers."""
+        while True:
+            try:
+                spoken_at, results = self._result_q.get_nowait()
+            except queue.Empty:
+                break
+            self._on_transcription_done(results, spoken_at)
 
-    def _on_transcription_done(self, results: list):
-        """Handle transcription results."""
+    def _on_transcription_done(self, results: list, spoken_at: datetime):
+        """Handle transcription results for a segment that ended at spoken_at."""
         self.status_bar.set_listening(self._listening)
 
+        entries = []
         for result in results:
             detected_lang = result.get("language", "").lower()
             speaker_id = result.get("speaker_id", 0)
@@ -628,29 +721,31 @@ class MainWindow(QMainWindow):
                     speaker_name = "Family"
                     speaker_id = 1
 
-            self.transcript.add_entry(
+            entries.append(dict(
                 original_text=result["text"],
                 translated_text=result["translation"],
                 speaker_id=speaker_id,
                 speaker_name=speaker_name,
                 language=result["language"],
                 is_user=is_user,
-            )
+                timestamp=spoken_at,
+            ))
 
             # TTS only when user speaks English - translate to Hungarian and speak
             if detected_lang == "en" and self.config.tts_enabled and result["translation"]:
                 self._speak_translation(result["translation"], "hu")
 
+        self.transcript.add_entries(entries)
+
     def _speak_translation(self, text: str, language: str):
         """Speak the translation."""
         def speak():
             try:
-                audio = self.pipeline.speak_translation(text, language)
-                self.player.play_wav(audio)
+                self.player.play_stream(self.pipeline.stream_tts(text, language))
             except APIError as e:
                 print(f"TTS error: {e}")
 
-        threading.Thread(target=speak, daemon=True).start()
+        self.tts_pool.start(speak)
 
     def _on_error(self, error: str):
         """Handle error."""
@@ -670,14 +765,6 @@ class MainWindow(QMainWindow):
 
         lang = self.enroll_lang_combo.currentText()
 
-        # Reading prompts in different languages
-        prompts = {
-            "HU": f"Szia, a nevem {name}. Ma szép idő van, és örülök, hogy itt lehetek veletek.",
-            "EN": f"Hello, my name is {name}. The weather is nice today, and I'm happy to be here with you.",
-            "DE": f"Hallo, mein Name ist {name}. Das Wetter ist heute schön, und ich freue mich, hier zu sein.",
-            "ES": f"Hola, me llamo {name}. El tiempo está bonito hoy, y estoy feliz de estar aquí.",
-        }
-
         # Stop listening if active
         was_listening = self._listening
         if was_listening:
@@ -686,7 +773,7 @@ class MainWindow(QMainWindow):
         # Show reading prompt in transcript
         self.transcript.add_entry(
             original_text=f"📖 {name}, please read:",
-            translated_text=prompts.get(lang, prompts["EN"]),
+            translated_text=_ENROLL_PROMPTS.get(lang, _ENROLL_PROMPTS["EN"]).format(name=name),
             speaker_id=7,  # Special color
             speaker_name="RECORDING",
             language=lang.lower(),
@@ -701,56 +788,67 @@ class MainWindow(QMainWindow):
         self.waveform.set_listening(True)  # Activate orb
 
         def do_enrollment():
+            enrolled = False
             try:
                 audio_data = self.recorder.record_for_enrollment(duration=5.0)
                 if audio_data:
                     result = self.pipeline.enroll_speaker(audio_data, name)
                     if result:
-                        self.transcript.add_entry(
+                        self.signals.transcript_entry.emit(dict(
                             original_text=f"✓ {name} enrolled successfully!",
                             translated_text="",
                             speaker_id=2,  # Green
                             speaker_name="SUCCESS",
                             language=lang.lower(),
                             is_user=False,
-                        )
-                        self._refresh_speakers_list()
-                        self.enroll_name_input.clear()
+                        ))
+                        enrolled = True
                     else:
-                        self.transcript.add_entry(
+                        self.signals.transcript_entry.emit(dict(
                             original_text=f"✗ Failed to enroll {name}",
                             translated_text="Try again with clearer audio",
                             speaker_id=1,  # Red
                             speaker_name="ERROR",
                             language=lang.lower(),
                             is_user=False,
-                        )
+                        ))
             except Exception as e:
-                self.transcript.add_entry(
+                self.signals.transcript_entry.emit(dict(
                     original_text=f"✗ Error: {e}",
                     translated_text="",
                     speaker_id=1,
                     speaker_name="ERROR",
                     language="en",
                     is_user=False,
-                )
+                ))
             finally:
-                self.enroll_btn.setEnabled(True)
-                self.enroll_name_input.setEnabled(True)
-                self.enroll_lang_combo.setEnabled(True)
-                self.enroll_btn.setText("🎤 Enroll Voice")
-                self.waveform.set_listening(was_listening)
-                self.status_bar.set_listening(was_listening)
-                if was_listening:
-                    QTimer.singleShot(500, self._start_listening)
-
-        threading.Thread(target=do_enrollment, daemon=True).start()
+                self.signals.enrollment_finished.emit(enrolled, was_listening)
+
+        self.transcribe_pool.start(do_enrollment)
+
+    def _on_enrollment_finished(self, enrolled: bool, was_listening: bool):
+        """Restore the enrollment controls and listening state after an enrollment."""
+        if enrolled:
+            self._refresh_speakers_list()
+            self.enroll_name_input.clear()
+        self.enroll_btn.setEnabled(True)
+        self.enroll_name_input.setEnabled(True)
+        self.enroll_lang_combo.setEnabled(True)
+        self.enroll_btn.setText("🎤 Enroll Voice")
+        self.waveform.set_listening(was_listening)
+        self.status_bar.set_listening(was_listening)
+        if was_listening:
+            QTimer.singleShot(500, self._start_listening)
 
     def _show_settings(self):
         """Show settings dialog."""
         from .settings_dialog import SettingsDialog
 
-        dialog = SettingsDialog(self.config, self)
+        # Created on first use and reused; it builds its widgets when first shown
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.config, self)
+        dialog = self._settings_dialog
+        dialog.config = self.config
         if dialog.exec():
             # Reload configuration
             self.config = dialog.config
@@ -765,25 +863,46 @@ class MainWindow(QMainWindow):
         )
         self.transcript.set_speaker_colors(self.config.speaker_colors)
 
-        # Reinit recorder with new settings
+        # Only reopen the audio stream if its format or device changed
+        recorder_dirty = self.recorder.needs_recreate(self.config)
+        pipeline_dirty = self.pipeline is None or self.pipeline.needs_recreate(self.config)
         was_listening = self._listening
-        if was_listening:
+        if was_listening and (recorder_dirty or pipeline_dirty):
             self._stop_listening()
 
-        self.recorder = AudioRecorder(
-            sample_rate=self.config.sample_rate,
-            channels=self.config.channels,
-            chunk_size=self.config.chunk_size,
-            device_index=self.config.input_device_index,
-            gain=self.config.gain,
-            silence_threshold=self.config.silence_threshold,
-            voice_timeout=self.config.voice_activity_timeout,
-        )
-
-        # Reinit pipeline
-        self.pipeline = TranslationPipeline(self.config)
-
-        if was_listening:
+        if recorder_dirty:
+            self.recorder = AudioRecorder(
+                sample_rate=self.config.sample_rate,
+                channels=self.config.channels,
+                chunk_size=self.config.chunk_size,
+                device_index=self.config.input_device_index,
+                gain=self.config.gain,
+                silence_threshold=self.config.silence_threshold,
+                voice_timeout=self.config.voice_activity_timeout,
+            )
+        else:
+            self.recorder.set_gain(self.config.gain)
+            self.recorder.set_silence_threshold(self.config.silence_threshold)
+            self.recorder.set_voice_timeout(self.config.voice_activity_timeout)
+
+        # Reinit pipeline only if a service moved
+        if pipeline_dirty:
+            if self.pipeline:
+                # Workers may still be using the old pipeline; let them finish first
+                self.transcribe_pool.waitForDone()
+                self.tts_pool.waitForDone()
+                self._segment_caches.clear()
+                self.pipeline.close()
+            self.pipeline = TranslationPipeline(self.config)
+            self.listen_btn.setEnabled(True)
+            self.enroll_btn.setEnabled(True)
+
+        # Reconnect if the diarization server moved
+        if str(self.http.base_url).rstrip("/") != self.config.diarization_url:
+            self.http.close()
+            self.http = self._create_http_client()
+
+        if was_listening and not self._listening:
             self._start_listening()
 
         self.config.save()
@@ -804,8 +923,11 @@ class MainWindow(QMainWindow):
             self.recorder.cleanup()
         if self.player:
             self.player.cleanup()
+        if self.pipeline:
+            self.pipeline.close()
         if self.hotkey_manager:
             self.hotkey_manager.stop()
+        self.http.close()
         self.config.save()
         QApplication.quit()
 
@@ -824,6 +946,12 @@ def main():
     app.setApplicationName("Turbo Translate")
     app.setOrganizationName("KnowAll AI")
 
+    # One shared font and style sheet for every widget
+    font = QFont(app.font())
+    font.setPointSize(10)
+    app.setFont(font)
+    app.setStyleSheet(APP_QSS)
+
     # Load config
     config = Config.load()
 
@@ -1,15 +1,111 @@
 """Audio recording with voice activity detection."""
 
-import io
 import platform
-import queue
+import struct
 import subprocess
-import threading
-import wave
-from typing import Callable
+import time
+from typing import Callable, NamedTuple
 
 import numpy as np
 
+from .config import Config
+
+try:
+    import numba
+except ImportError:  # optional speedup, see the "fast" extra
+    numba = None
+
+# Canonical 16-bit PCM WAV header: RIFF size at offset 4, data size at offset 40
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+# Size of the header _frames_to_wav writes before the PCM data
+WAV_HEADER_SIZE = _WAV_HEADER.size
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _store_chunk(
+        samples: np.ndarray, dest: np.ndarray, offset: int, gain: float, scratch: np.ndarray
+    ) -> tuple[float, float]:
+        """
+        Copy int16 samples into dest at offset and return their level and peak.
+
+        Both are computed in the same pass: the level is the mean absolute amplitude
+        and the peak the largest one, each scaled by gain to 0.0-1.0.
+        """
+        n = samples.shape[0]
+        if n == 0:
+            return 0.0, 0.0
+        acc = 0.0
+        peak = 0.0
+        for i in range(n):
+            x = samples[i]
+            dest[offset + i] = x
+            v = float(x)
+            a = v if v >= 0.0 else -v
+            acc += a
+            if a > peak:
+                peak = a
+        return acc * gain / (32768.0 * n), peak * gain / 32768.0
+
+    # Compile (or load from cache) now, for the read-only chunks np.frombuffer gives
+    # _on_audio, so the first call on the audio thread does not stall it
+    _store_chunk(
+        np.frombuffer(bytes(2), dtype=np.int16), np.empty(1, np.int16), 0, 1.0,
+        np.empty(1, np.int16),
+    )
+
+else:
+
+    def _store_chunk(
+        samples: np.ndarray, dest: np.ndarray, offset: int, gain: float, scratch: np.ndarray
+    ) -> tuple[float, float]:
+        """
+        Copy int16 samples into dest at offset and return their level and peak.
+
+        The level is the mean absolute amplitude and the peak the largest one, each
+        scaled by gain to 0.0-1.0. They are computed on int16 directly (no float cast)
+        using scratch, an int16 buffer at least as long as samples; abs(-32768) wraps
+        in int16, so the magnitudes are read back as uint16.
+        """
+        if samples.size == 0:
+            return 0.0, 0.0
+        dest[offset:offset + samples.size] = samples
+        magnitudes = np.abs(samples, out=scratch[:samples.size]).view(np.uint16)
+        abs_sum = int(magnitudes.sum(dtype=np.int64))
+        peak = int(magnitudes.max())
+        return abs_sum * gain / (32768.0 * samples.size), peak * gain / 32768.0
+
+
+# A chunk also counts as voice if its peak exceeds the silence threshold by this
+# factor (roughly the peak-to-mean ratio of speech): short sounds such as
+# consonants raise the peak but are diluted in the chunk's mean level
+PEAK_VOICE_FACTOR = 4.0
+
+# Interval over which chunk levels are combined (max) before being published
+LEVEL_WINDOW_SECONDS = 0.033
+
+# Initial capacity of the segment buffer; it grows if a segment runs longer
+SEGMENT_BUFFER_SECONDS = 30
+
+
+class _CaptureParams(NamedTuple):
+    """Settings the capture callback reads, replaced as a whole when one changes."""
+
+    gain: float
+    silence_threshold: float
+    frames_for_timeout: int  # silent chunks that end a segment
+    timeout_samples: int  # samples in those chunks, trimmed from the segment
+    chunk_callback: Callable[[bytes, bool], None] | None
+    segment_callback: Callable[[bytes], None] | None
+
+
+# How long an enumeration is reused before devices are queried again
+DEVICES_CACHE_TTL = 60.0
+
+# (monotonic time, input devices) of the last enumeration, see AudioRecorder.list_devices()
+_devices_cache: tuple[float, list[dict]] | None = None
+
 
 class AudioRecorder:
     """Records audio from microphone with voice activity detection."""
@@ -32,22 +128,85 @@ class AudioRecorder:
         self.silence_threshold = silence_threshold
         self.voice_timeout = voice_timeout
 
+        # Header for this recorder's format; the size fields are patched per segment
+        self._wav_header = _WAV_HEADER.pack(
+            b"RIFF", 36, b"WAVE",
+            b"fmt ", 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+            b"data", 0,
+        )
+
         self._pyaudio = None
         self._stream = None
         self._recording = False
-        self._thread = None
-        self._frames: list[bytes] = []
+        self._callback_result = None  # (None, paContinue), set when the stream opens
+        # Latest chunk level; written by the capture callback only, polled via get_level()
         self._level = 0.0
-        self._level_lock = threading.Lock()
+        self._window_level = 0.0  # loudest chunk of the current level window
+        self._window_start = 0.0
+        self._last_chunk: np.ndarray | None = None  # int16 view of the latest chunk
+        self._level_scratch = np.empty(chunk_size * channels, np.int16)
+
+        # Samples of the segment being recorded, valid up to _segment_len
+        self._segment = np.empty(int(SEGMENT_BUFFER_SECONDS * sample_rate * channels), np.int16)
+        self._segment_len = 0
 
         # Voice activity detection
         self._voice_active = False
-        self._silence_start = 0.0
-        self._audio_queue: queue.Queue = queue.Queue()
+        self._silence_frames = 0
 
         # Callbacks
-        self._level_callback: Callable[[float], None] | None = None
         self._segment_callback: Callable[[bytes], None] | None = None
+        self._chunk_callback: Callable[[bytes, bool], None] | None = None
+
+        # Snapshot of the settings for the capture callback, see _update_params()
+        self._update_params()
+
+    def needs_recreate(self, config: Config) -> bool:
+        """
+        Check whether config changes parameters fixed when the recorder was created.
+
+        Gain, silence threshold and voice timeout can be changed in place with the
+        set_* methods instead.
+
+        Args:
+            config: Configuration to compare against
+
+        Returns:
+            True if a new recorder is needed to pick up the changes
+        """
+        return (
+            self.sample_rate != config.sample_rate
+            or self.channels != config.channels
+            or self.chunk_size != config.chunk_size
+            or self.device_index != config.input_device_index
+        )
+
+    def set_gain(self, gain: float):
+        """Set the input gain; takes effect from the next chunk."""
+        self.gain = gain
+        self._update_params()
+
+    def set_silence_threshold(self, threshold: float):
+        """Set the voice activity threshold; takes effect from the next chunk."""
+        self.silence_threshold = threshold
+        self._update_params()
+
+    def set_voice_timeout(self, timeout: float):
+        """Set the silence duration that ends a segment; takes effect from the next chunk."""
+        self.voice_timeout = timeout
+        self._update_params()
+
+    def _update_params(self):
+        """Publish the current settings to the capture callback in one attribute store."""
+        frames_for_timeout = int(self.voice_timeout * self.sample_rate / self.chunk_size)
+        self._params = _CaptureParams(
+            gain=self.gain,
+            silence_threshold=self.silence_threshold,
+            frames_for_timeout=frames_for_timeout,
+            timeout_samples=frames_for_timeout * self.chunk_size * self.channels,
+            chunk_callback=self._chunk_callback,
+            segment_callback=self._segment_callback,
+        )
 
     def _init_pyaudio(self):
         """Initialize PyAudio."""
@@ -58,29 +217,65 @@ class AudioRecorder:
 
     def get_devices(self) -> list[dict]:
         """Get available input devices."""
-        self._init_pyaudio()
-        devices = []
+        return self.list_devices()
 
+    @staticmethod
+    def list_devices(refresh: bool = False) -> list[dict]:
+        """
+        Get available input devices without needing a recorder instance.
+
+        The list is reused for DEVICES_CACHE_TTL seconds, or until a refresh is
+        requested or the cache is invalidated.
+
+        Args:
+            refresh: Re-enumerate devices instead of using the cached list
+
+        Returns:
+            List of input devices with index, name, channels, sample_rate
+        """
+        global _devices_cache
+        now = time.monotonic()
+        if refresh or _devices_cache is None or now - _devices_cache[0] >= DEVICES_CACHE_TTL:
+            _devices_cache = (now, AudioRecorder._enumerate_devices())
+        return _devices_cache[1]
+
+    @staticmethod
+    def invalidate_devices_cache():
+        """Make the next list_devices() call enumerate devices again."""
+        global _devices_cache
+        _devices_cache = None
+
+    @staticmethod
+    def _enumerate_devices() -> list[dict]:
+        """Query the system for input devices."""
         # On Linux, prefer PipeWire sources
         if platform.system() == "Linux":
-            pw_sources = self._get_pipewire_sources()
+            pw_sources = AudioRecorder._get_pipewire_sources()
             if pw_sources:
                 return pw_sources
 
-        # Fall back to PyAudio enumeration
-        for i in range(self._pyaudio.get_device_count()):
-            info = self._pyaudio.get_device_info_by_index(i)
-            if info["maxInputChannels"] > 0:
-                devices.append({
-                    "index": i,
-                    "name": info["name"],
-                    "channels": info["maxInputChannels"],
-                    "sample_rate": int(info["defaultSampleRate"]),
-                })
+        # Fall back to PyAudio enumeration with a short-lived handle
+        import pyaudio
+
+        pa = pyaudio.PyAudio()
+        devices = []
+        try:
+            for i in range(pa.get_device_count()):
+                info = pa.get_device_info_by_index(i)
+                if info["maxInputChannels"] > 0:
+                    devices.append({
+                        "index": i,
+                        "name": info["name"],
+                        "channels": info["maxInputChannels"],
+                        "sample_rate": int(info["defaultSampleRate"]),
+                    })
+        finally:
+            pa.terminate()
 
         return devices
 
-    def _get_pipewire_sources(self) -> list[dict]:
+    @staticmethod
+    def _get_pipewire_sources() -> list[dict]:
         """Get PipeWire audio sources on Linux."""
         try:
             result = subprocess.run(
@@ -127,28 +322,35 @@ class AudioRecorder:
 
     def start_continuous(
         self,
-        level_callback: Callable[[float], None] | None = None,
         segment_callback: Callable[[bytes], None] | None = None,
+        chunk_callback: Callable[[bytes, bool], None] | None = None,
     ):
         """
         Start continuous listening with voice activity detection.
 
         Args:
-            level_callback: Called with audio level (0.0-1.0)
             segment_callback: Called with WAV data when speech segment ends
+            chunk_callback: Called with each raw PCM chunk added to the current
+                segment while it is recorded, and whether it starts a new segment.
+                The finished segment may drop trailing chunks (see segment_callback).
         """
         if self._recording:
             return
 
         self._init_pyaudio()
-        self._level_callback = level_callback
         self._segment_callback = segment_callback
+        self._chunk_callback = chunk_callback
         self._recording = True
-        self._frames = []
+        self._segment_len = 0
         self._voice_active = False
+        self._update_params()
+        self._silence_frames = 0
+        self._window_level = 0.0
+        self._window_start = time.monotonic()
 
         import pyaudio
 
+        self._callback_result = (None, pyaudio.paContinue)
         try:
             self._stream = self._pyaudio.open(
                 format=pyaudio.paInt16,
@@ -157,86 +359,102 @@ class AudioRecorder:
                 input=True,
                 input_device_index=self.device_index,
                 frames_per_buffer=self.chunk_size,
+                stream_callback=self._on_audio,
+                start=False,
             )
+            self._stream.start_stream()
         except Exception as e:
             print(f"Error opening audio stream: {e}")
+            self._stream = None
             self._recording = False
             return
 
-        self._thread = threading.Thread(target=self._continuous_loop, daemon=True)
-        self._thread.start()
+    def _on_audio(self, data: bytes, frame_count: int, time_info: dict, status: int):
+        """Handle one captured chunk with VAD (PortAudio callback thread)."""
+        # One consistent view of the settings for this chunk
+        (
+            gain, silence_threshold, frames_for_timeout, timeout_samples,
+            chunk_callback, segment_callback,
+        ) = self._params
+
+        # Write the chunk after the segment so far and calculate its level (mean
+        # absolute amplitude; gain scales the result linearly). The chunk only
+        # becomes part of the segment if _segment_len is advanced past it below;
+        # otherwise the next chunk overwrites it.
+        chunk = np.frombuffer(data, dtype=np.int16)
+        self._last_chunk = chunk
+        if chunk.size > self._level_scratch.size:
+            self._level_scratch = np.empty(chunk.size, np.int16)
+        chunk_end = self._reserve_segment(chunk.size)
+        level, peak = _store_chunk(
+            chunk, self._segment, self._segment_len, gain, self._level_scratch
+        )
+
+        # Publish the loudest chunk once per display frame; a single attribute
+        # store, so readers never need a lock
+        self._window_level = max(self._window_level, level)
+        now = time.monotonic()
+        if now - self._window_start >= LEVEL_WINDOW_SECONDS:
+            self._level = self._window_level
+            self._window_level = 0.0
+            self._window_start = now
 
-    def _continuous_loop(self):
-        """Continuous recording loop with VAD."""
-        import time
-
-        silence_frames = 0
-        frames_for_timeout = int(self.voice_timeout * self.sample_rate / self.chunk_size)
-
-        while self._recording:
-            try:
-                data = self._stream.read(self.chunk_size, exception_on_overflow=False)
-            except Exception:
-                continue
-
-            # Calculate level
-            samples = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-            samples = samples * self.gain
-            level = np.abs(samples).mean() / 32768.0
-
-            with self._level_lock:
-                self._level = level
-
-            if self._level_callback:
-                self._level_callback(level)
-
-            # Voice activity detection
-            is_voice = level > self.silence_threshold
-
-            if is_voice:
-                if not self._voice_active:
-                    # Voice started
-                    self._voice_active = True
-                    self._frames = []
-                silence_frames = 0
-                self._frames.append(data)
-            elif self._voice_active:
-                # Voice was active, now silent
-                silence_frames += 1
-                self._frames.append(data)  # Keep some silence
-
-                if silence_frames >= frames_for_timeout:
-                    # Speech segment ended
-                    self._voice_active = False
-                    if len(self._frames) > frames_for_timeout:
-                        # Remove trailing silence
-                        self._frames = self._frames[:-frames_for_timeout]
-
-                    if self._frames and self._segment_callback:
-                        wav_data = self._frames_to_wav(self._frames)
-                        self._segment_callback(wav_data)
-
-                    self._frames = []
-                    silence_frames = 0
-
-    def _frames_to_wav(self, frames: list[bytes]) -> bytes:
-        """Convert frames to WAV format."""
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(b"".join(frames))
-        return buffer.getvalue()
+        # Voice activity detection
+        is_voice = level > silence_threshold or peak > silence_threshold * PEAK_VOICE_FACTOR
+
+        if is_voice:
+            segment_start = not self._voice_active
+            if segment_start:
+                # Voice started; the segment is empty, so the chunk is at its start
+                self._voice_active = True
+            self._silence_frames = 0
+            self._segment_len = chunk_end
+            if chunk_callback:
+                chunk_callback(data, segment_start)
+        elif self._voice_active:
+            # Voice was active, now silent
+            self._silence_frames += 1
+            self._segment_len = chunk_end  # Keep some silence
+            if chunk_callback:
+                chunk_callback(data, False)
+
+            if self._silence_frames >= frames_for_timeout:
+                # Speech segment ended
+                self._voice_active = False
+                if self._segment_len > timeout_samples:
+                    # Remove trailing silence
+                    self._segment_len -= timeout_samples
+
+                if self._segment_len and segment_callback:
+                    wav_data = self._frames_to_wav(self._segment, self._segment_len)
+                    segment_callback(wav_data)
+
+                self._segment_len = 0
+                self._silence_frames = 0
+
+        return self._callback_result
+
+    def _reserve_segment(self, count: int) -> int:
+        """Make room for count more samples in the segment buffer; returns their end."""
+        end = self._segment_len + count
+        if end > self._segment.size:
+            grown = np.empty(max(end, 2 * self._segment.size), np.int16)
+            grown[:self._segment_len] = self._segment[:self._segment_len]
+            self._segment = grown
+        return end
+
+    def _frames_to_wav(self, samples: np.ndarray, length: int) -> bytes:
+        """Convert the first length int16 samples to WAV format."""
+        payload = memoryview(samples[:length]).cast("B")
+        header = bytearray(self._wav_header)
+        struct.pack_into("<I", header, 4, 36 + payload.nbytes)
+        struct.pack_into("<I", header, 40, payload.nbytes)
+        return b"".join((header, payload))
 
     def stop(self):
         """Stop recording."""
         self._recording = False
 
-        if self._thread:
-            self._thread.join(timeout=1.0)
-            self._thread = None
-
         if self._stream:
             try:
                 self._stream.stop_stream()
@@ -245,10 +463,32 @@ class AudioRecorder:
                 pass
             self._stream = None
 
+        self._level = 0.0
+        self._last_chunk = None
+
     def get_level(self) -> float:
-        """Get current audio level."""
-        with self._level_lock:
-            return self._level
+        """Get the audio level (0.0-1.0): the loudest chunk of the last level window."""
+        return self._level
+
+    def get_recent_samples(self, count: int) -> np.ndarray:
+        """
+        Get the most recently captured samples for visualization.
+
+        Reads the latest chunk without any work on the capture thread; the
+        conversion happens on the caller's thread.
+
+        Args:
+            count: Maximum number of samples to return
+
+        Returns:
+            Up to count float32 samples (-1.0 to 1.0) from the end of the latest chunk
+        """
+        chunk = self._last_chunk
+        if chunk is None:
+            return np.zeros(0, np.float32)
+        samples = chunk[-count:].astype(np.float32)
+        samples *= 1.0 / 32768.0
+        return samples
 
     def cleanup(self):
         """Clean up resources."""
@@ -259,6 +499,7 @@ class AudioRecorder:
             except Exception:
                 pass
             self._pyaudio = None
+        self.invalidate_devices_cache()
 
     def record_for_enrollment(self, duration: float = 5.0) -> bytes:
         """
@@ -273,7 +514,10 @@ class AudioRecorder:
         self._init_pyaudio()
         import pyaudio
 
-        frames = []
+        # Chunk count is known up front, so the samples go into one preallocated array
+        num_chunks = int(duration * self.sample_rate / self.chunk_size)
+        step = self.chunk_size * self.channels
+        samples = np.empty(num_chunks * step, np.int16)
 
         try:
             stream = self._pyaudio.open(
@@ -285,10 +529,10 @@ class AudioRecorder:
                 frames_per_buffer=self.chunk_size,
             )
 
-            num_chunks = int(duration * self.sample_rate / self.chunk_size)
-            for _ in range(num_chunks):
+            # PyAudio has no readinto(); copy each chunk straight to its offset
+            for offset in range(0, samples.size, step):
                 data = stream.read(self.chunk_size, exception_on_overflow=False)
-                frames.append(data)
+                samples[offset:offset + step] = np.frombuffer(data, dtype=np.int16)
 
             stream.stop_stream()
             stream.close()
@@ -297,4 +541,4 @@ class AudioRecorder:
             print(f"Enrollment recording error: {e}")
             return b""
 
-        return self._frames_to_wav(frames)
+        return self._frames_to_wav(samples, samples.size)
@@ -23,66 +23,31 @@ from .recorder import AudioRecorder
 
 
 class SettingsDialog(QDialog):
-    """Settings configuration dialog."""
+    """
+    Settings configuration dialog.
+
+    The widgets (and the input device list) are built on first show, and the
+    current config values are loaded on every show, so one instance can be reused.
+    Its look comes from the application style sheet (see styles.py).
+    """
 
     def __init__(self, config: Config, parent=None):
         super().__init__(parent)
         self.config = config
-        self._recorder = AudioRecorder()
-        self._setup_ui()
+        self._built = False
+
+    def showEvent(self, event):
+        """Build the UI on first show and load the current config values."""
+        if not self._built:
+            self._setup_ui()
+            self._built = True
         self._load_values()
+        super().showEvent(event)
 
     def _setup_ui(self):
         """Set up the dialog UI."""
         self.setWindowTitle("Settings")
         self.setMinimumSize(500, 400)
-        self.setStyleSheet(
-            "QDialog {"
-            "  background-color: #0f172a;"
-            "}"
-            "QLabel {"
-            "  color: #e2e8f0;"
-            "}"
-            "QGroupBox {"
-            "  color: #e2e8f0;"
-            "  font-weight: bold;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 8px;"
-            "  margin-top: 8px;"
-            "  padding-top: 12px;"
-            "}"
-            "QGroupBox::title {"
-            "  subcontrol-origin: margin;"
-            "  left: 8px;"
-            "}"
-            "QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {"
-            "  background-color: #1e293b;"
-            "  color: #e2e8f0;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 4px;"
-            "  padding: 6px;"
-            "}"
-            "QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {"
-            "  border-color: #3b82f6;"
-            "}"
-            "QTabWidget::pane {"
-            "  border: 1px solid #334155;"
-            "  border-radius: 8px;"
-            "  background-color: #0f172a;"
-            "}"
-            "QTabBar::tab {"
-            "  background-color: #1e293b;"
-            "  color: #94a3b8;"
-            "  padding: 8px 16px;"
-            "  margin-right: 2px;"
-            "  border-top-left-radius: 4px;"
-            "  border-top-right-radius: 4px;"
-            "}"
-            "QTabBar::tab:selected {"
-            "  background-color: #3b82f6;"
-            "  color: white;"
-            "}"
-        )
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -129,10 +94,13 @@ class SettingsDialog(QDialog):
         audio_form = QFormLayout(audio_group)
 
         self.input_device = QComboBox()
-        devices = self._recorder.get_devices()
-        for dev in devices:
-            self.input_device.addItem(dev["name"], dev["index"])
-        audio_form.addRow("Input Device:", self.input_device)
+        self._populate_devices()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(lambda: self._populate_devices(refresh=True))
+        device_layout = QHBoxLayout()
+        device_layout.addWidget(self.input_device, 1)
+        device_layout.addWidget(refresh_btn)
+        audio_form.addRow("Input Device:", device_layout)
 
         self.gain_slider = QSlider(Qt.Orientation.Horizontal)
         self.gain_slider.setRange(0, 200)
@@ -191,40 +159,31 @@ class SettingsDialog(QDialog):
         button_layout.addStretch()
 
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet(
-            "QPushButton {"
-            "  background-color: #1e293b;"
-            "  color: #e2e8f0;"
-            "  border: 1px solid #334155;"
-            "  border-radius: 6px;"
-            "  padding: 8px 24px;"
-            "}"
-            "QPushButton:hover {"
-            "  background-color: #334155;"
-            "}"
-        )
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet(
-            "QPushButton {"
-            "  background-color: #3b82f6;"
-            "  color: white;"
-            "  border: none;"
-            "  border-radius: 6px;"
-            "  padding: 8px 24px;"
-            "  font-weight: bold;"
-            "}"
-            "QPushButton:hover {"
-            "  background-color: #2563eb;"
-            "}"
-        )
+        save_btn.setObjectName("saveBtn")
         save_btn.clicked.connect(self._save_and_close)
         button_layout.addWidget(save_btn)
 
         layout.addLayout(button_layout)
 
+    def _populate_devices(self, refresh: bool = False):
+        """
+        Fill the input device list, keeping the current selection if it still exists.
+
+        Args:
+            refresh: Re-enumerate devices instead of using AudioRecorder's cached list
+        """
+        selected = self.input_device.currentData()
+        self.input_device.clear()
+        for dev in AudioRecorder.list_devices(refresh=refresh):
+            self.input_device.addItem(dev["name"], dev["index"])
+        index = self.input_device.findData(selected)
+        if index >= 0:
+            self.input_device.setCurrentIndex(index)
+
     def _load_values(self):
         """Load current config values into UI."""
         self.server_host.setText(self.config.server_host)
@@ -253,6 +212,7 @@ class SettingsDialog(QDialog):
         self.config.diarization_port = self.diarization_port.value()
         self.config.translation_port = self.translation_port.value()
         self.config.tts_port = self.tts_port.value()
+        self.config.rebuild_urls()
 
         self.config.input_device_index = self.input_device.currentData()
         self.config.input_device_name = self.input_device.currentText()
@@ -0,0 +1,213 @@
+"""Application style sheet."""
+
+# Parsed once by QApplication.setStyleSheet() in main(). Widgets pick up their rules through
+# class names and object names, so none of them needs a style sheet of its own.
+APP_QSS = (
+    # Main window
+    "QMainWindow {"
+    "  background-color: #0f172a;"
+    "}"
+    "QLabel {"
+    "  color: #e2e8f0;"
+    "}"
+    "QWidget#leftPanel, QWidget#rightPanel {"
+    "  background-color: #0f172a;"
+    "}"
+    "QLabel#sectionLabel {"
+    "  color: #94a3b8;"
+    "  font-size: 12px;"
+    "}"
+    "QLabel#speakersEmpty {"
+    "  color: #64748b;"
+    "  font-size: 11px;"
+    "  font-style: italic;"
+    "}"
+    "QGroupBox {"
+    "  color: #e2e8f0;"
+    "  font-weight: bold;"
+    "  border: 1px solid #334155;"
+    "  border-radius: 8px;"
+    "  margin-top: 8px;"
+    "  padding-top: 8px;"
+    "}"
+    "QGroupBox::title {"
+    "  subcontrol-origin: margin;"
+    "  left: 8px;"
+    "}"
+    "QComboBox {"
+    "  background-color: #1e293b;"
+    "  color: #e2e8f0;"
+    "  border: 1px solid #334155;"
+    "  border-radius: 4px;"
+    "  padding: 4px 8px;"
+    "}"
+    "QComboBox:hover {"
+    "  border-color: #3b82f6;"
+    "}"
+    "QComboBox::drop-down {"
+    "  border: none;"
+    "}"
+    "QComboBox QAbstractItemView {"
+    "  background-color: #1e293b;"
+    "  color: #e2e8f0;"
+    "  selection-background-color: #3b82f6;"
+    "}"
+    "QLineEdit#enrollName {"
+    "  background-color: #1e293b;"
+    "  color: #e2e8f0;"
+    "  border: 1px solid #334155;"
+    "  border-radius: 4px;"
+    "  padding: 6px;"
+    "}"
+    "QLineEdit#enrollName:focus {"
+    "  border-color: #3b82f6;"
+    "}"
+    "QPushButton#listenBtn {"
+    "  background-color: #3b82f6;"
+    "  color: white;"
+    "  border: none;"
+    "  border-radius: 8px;"
+    "  font-size: 14px;"
+    "  font-weight: bold;"
+    "}"
+    "QPushButton#listenBtn:hover {"
+    "  background-color: #2563eb;"
+    "}"
+    "QPushButton#listenBtn:pressed {"
+    "  background-color: #1d4ed8;"
+    "}"
+    "QPushButton#enrollBtn, QPushButton#ttsBtn {"
+    "  background-color: #1e293b;"
+    "  color: #94a3b8;"
+    "  border: 1px solid #334155;"
+    "  border-radius: 6px;"
+    "  padding: 8px;"
+    "}"
+    "QPushButton#enrollBtn:hover {"
+    "  background-color: #334155;"
+    "  color: #e2e8f0;"
+    "}"
+    "QPushButton#enrollBtn:disabled {"
+    "  background-color: #ef4444;"
+    "  color: white;"
+    "  border-color: #ef4444;"
+    "}"
+    "QPushButton#ttsBtn:checked {"
+    "  background-color: #22c55e;"
+    "  color: white;"
+    "  border-color: #22c55e;"
+    "}"
+    "QPushButton#settingsBtn {"
+    "  background-color: transparent;"
+    "  color: #94a3b8;"
+    "  border: 1px solid #334155;"
+    "  border-radius: 6px;"
+    "  padding: 8px;"
+    "}"
+    "QPushButton#settingsBtn:hover {"
+    "  background-color: #1e293b;"
+    "}"
+    "QPushButton#speakerDelete {"
+    "  background: transparent;"
+    "  color: #64748b;"
+    "  border: none;"
+    "  font-size: 14px;"
+    "}"
+    "QPushButton#speakerDelete:hover {"
+    "  color: #ef4444;"
+    "}"
+    # Transcript panel
+    "QWidget#transcriptHeader {"
+    "  background-color: #0f172a;"
+    "}"
+    "QLabel#transcriptTitle {"
+    "  color: #e2e8f0;"
+    "  font-size: 14px;"
+    "  font-weight: bold;"
+    "}"
+    "QListView#transcriptView {"
+    "  background-color: #0f172a;"
+    "  border: none;"
+    "  padding: 16px;"
+    "}"
+    "QListView#transcriptView QScrollBar:vertical {"
+    "  background-color: #1e293b;"
+    "  width: 8px;"
+    "}"
+    "QListView#transcriptView QScrollBar::handle:vertical {"
+    "  background-color: #334155;"
+    "  border-radius: 4px;"
+    "}"
+    "QListView#transcriptView QScrollBar::add-line:vertical,"
+    " QListView#transcriptView QScrollBar::sub-line:vertical {"
+    "  height: 0px;"
+    "}"
+    # Status bar
+    "StatusBar {"
+    "  background-color: #0f172a;"
+    "  border-top: 1px solid #1e293b;"
+    "}"
+    "QLabel#statusText {"
+    "  color: #94a3b8;"
+    "  font-size: 12px;"
+    "}"
+    "QLabel#statusLanguages {"
+    "  color: #64748b;"
+    "  font-size: 11px;"
+    "}"
+    # Settings dialog
+    "SettingsDialog {"
+    "  background-color: #0f172a;"
+    "}"
+    "SettingsDialog QGroupBox {"
+    "  padding-top: 12px;"
+    "}"
+    "SettingsDialog QLineEdit, SettingsDialog QSpinBox,"
+    " SettingsDialog QDoubleSpinBox, SettingsDialog QComboBox {"
+    "  background-color: #1e293b;"
+    "  color: #e2e8f0;"
+    "  border: 1px solid #334155;"
+    "  border-radius: 4px;"
+    "  padding: 6px;"
+    "}"
+    "SettingsDialog QLineEdit:focus, SettingsDialog QSpinBox:focus,"
+    " SettingsDialog QDoubleSpinBox:focus, SettingsDialog QComboBox:focus {"
+    "  border-color: #3b82f6;"
+    "}"
+    "SettingsDialog QTabWidget::pane {"
+    "  border: 1px solid #334155;"
+    "  border-radius: 8px;"
+    "  background-color: #0f172a;"
+    "}"
+    "SettingsDialog QTabBar::tab {"
+    "  background-color: #1e293b;"
+    "  color: #94a3b8;"
+    "  padding: 8px 16px;"
+    "  margin-right: 2px;"
+    "  border-top-left-radius: 4px;"
+    "  border-top-right-radius: 4px;"
+    "}"
+    "SettingsDialog QTabBar::tab:selected {"
+    "  background-color: #3b82f6;"
+    "  color: white;"
+    "}"
+    "SettingsDialog QPushButton {"
+    "  background-color: #1e293b;"
+    "  color: #e2e8f0;"
+    "  border: 1px solid #334155;"
+    "  border-radius: 6px;"
+    "  padding: 8px 24px;"
+    "}"
+    "SettingsDialog QPushButton:hover {"
+    "  background-color: #334155;"
+    "}"
+    "QPushButton#saveBtn {"
+    "  background-color: #3b82f6;"
+    "  color: white;"
+    "  border: none;"
+    "  font-weight: bold;"
+    "}"
+    "QPushButton#saveBtn:hover {"
+    "  background-color: #2563eb;"
+    "}"
+)
@@ -2,14 +2,25 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from typing import Optional
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath
 from PyQt6.QtWidgets import (
-    QFrame,
+    QAbstractItemView,
     QHBoxLayout,
     QLabel,
-    QScrollArea,
+    QListView,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
@@ -23,118 +34,264 @@ class TranscriptEntry:
     translated_text: str
     speaker_id: int
     speaker_name: str
-    speaker_color: str
+    speaker_color: QColor
     timestamp: datetime
+    time_text: str  # timestamp as HH:MM:SS, formatted once for painting
     language: str
     is_user: bool = False
 
 
-class TranscriptBubble(QFrame):
-    """A single message bubble in the transcript."""
+# Role under which TranscriptModel hands out the TranscriptEntry for a row
+ENTRY_ROLE = Qt.ItemDataRole.UserRole.value
+
 
-    def __init__(self, entry: TranscriptEntry, parent=None):
+class TranscriptModel(QAbstractListModel):
+    """List model over transcript entries, newest entry in row 0."""
+
+    def __init__(self, entries: list[TranscriptEntry], parent=None):
+        """
+        Args:
+            entries: Entries in chronological order; the model appends to this list
+            parent: Parent object
+        """
         super().__init__(parent)
-        self.entry = entry
-        self._setup_ui()
+        self._entries = entries
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of entries (none below the root)."""
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole.value):
+        """Return the entry for ENTRY_ROLE, its original text for the display role."""
+        if not index.isValid():
+            return None
+        entry = self._entries[len(self._entries) - 1 - index.row()]
+        if role == ENTRY_ROLE:
+            return entry
+        if role == Qt.ItemDataRole.DisplayRole.value:
+            return entry.original_text
+        return None
+
+    def add_entries(self, entries: list[TranscriptEntry]):
+        """Append entries; being newer, they become the top rows."""
+        if not entries:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
 
-    def _setup_ui(self):
-        """Set up the bubble UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(4)
-
-        # Speaker header
-        header_layout = QHBoxLayout()
-        header_layout.setSpacing(8)
-
-        # Speaker indicator dot
-        dot = QLabel()
-        dot.setFixedSize(12, 12)
-        dot.setStyleSheet(
-            f"background-color: {self.entry.speaker_color}; "
-            f"border-radius: 6px;"
+    def clear(self):
+        """Remove all entries."""
+        self.beginResetModel()
+        self._entries.clear()
+        self.endResetModel()
+
+
+class BubbleDelegate(QStyledItemDelegate):
+    """
+    Paints a transcript entry as a message bubble.
+
+    Everything is drawn with QPainter, so an entry costs no widgets; heights are cached
+    per entry and view width.
+    """
+
+    # Geometry, in pixels
+    GAP = 12  # Space below each bubble
+    PADDING_X = 12
+    PADDING_Y = 8
+    ACCENT_WIDTH = 3  # Speaker-colored accent on the left edge
+    RADIUS = 8
+    DOT_SIZE = 10
+    SPACING = 8  # Between header items
+    LINE_SPACING = 4  # Between header and text blocks
+    TEXT_PADDING = 4  # Above and below each text block
+    QUOTE_INDENT = 10  # Translation border plus its padding
+
+    # Colors
+    BUBBLE_COLOR = QColor("#1e293b")
+    META_COLOR = QColor("#64748b")
+    ORIGINAL_COLOR = QColor("#e2e8f0")
+    TRANSLATION_COLOR = QColor("#94a3b8")
+    QUOTE_COLOR = QColor("#334155")
+
+    def __init__(self, view: QListView):
+        super().__init__(view)
+        self._view = view
+        base = view.font()
+
+        self._name_font = QFont(base)
+        self._name_font.setPixelSize(12)
+        self._name_font.setBold(True)
+        self._meta_font = QFont(base)
+        self._meta_font.setPixelSize(10)
+        self._original_font = QFont(base)
+        self._original_font.setPixelSize(14)
+        self._translation_font = QFont(base)
+        self._translation_font.setPixelSize(13)
+        self._translation_font.setItalic(True)
+
+        self._name_metrics = QFontMetrics(self._name_font)
+        self._original_metrics = QFontMetrics(self._original_font)
+        self._translation_metrics = QFontMetrics(self._translation_font)
+        self._header_height = max(self._name_metrics.height(), self.DOT_SIZE)
+
+        # id(entry) -> (width, original text height, translation text height); one slot per
+        # entry, overwritten when the view width changes
+        self._text_heights: dict[int, tuple[int, int, int]] = {}
+
+    def clear_cache(self):
+        """Forget cached text heights; call when the entries are removed."""
+        self._text_heights.clear()
+
+    @staticmethod
+    def _translation(entry: TranscriptEntry) -> str:
+        """The translation to show, or an empty string if it adds nothing."""
+        if entry.translated_text and entry.translated_text != entry.original_text:
+            return entry.translated_text
+        return ""
+
+    def _text_width(self, width: int) -> int:
+        """Width available to the text blocks in a bubble of the given width."""
+        return max(width - self.ACCENT_WIDTH - 2 * self.PADDING_X, 1)
+
+    def _measure(self, entry: TranscriptEntry, width: int) -> tuple[int, int]:
+        """Return the wrapped heights of the original and translated text."""
+        cached = self._text_heights.get(id(entry))
+        if cached is not None and cached[0] == width:
+            return cached[1], cached[2]
+
+        text_width = self._text_width(width)
+        wrap = Qt.TextFlag.TextWordWrap
+        original = self._original_metrics.boundingRect(
+            QRect(0, 0, text_width, 0), wrap, entry.original_text
+        ).height()
+        translation = self._translation(entry)
+        if translation:
+            translated = self._translation_metrics.boundingRect(
+                QRect(0, 0, max(text_width - self.QUOTE_INDENT, 1), 0), wrap, translation
+            ).height()
+        else:
+            translated = 0
+        self._text_heights[id(entry)] = (width, original, translated)
+        return original, translated
+
+    def sizeHint(self, option, index) -> QSize:
+        """Size of the bubble at the view's current width, gap included."""
+        width = self._view.viewport().width() - 2 * self._view.spacing()
+        original, translated = self._measure(index.data(ENTRY_ROLE), width)
+        height = (
+            2 * self.PADDING_Y
+            + self._header_height
+            + self.LINE_SPACING
+            + original
+            + 2 * self.TEXT_PADDING
         )
-        header_layout.addWidget(dot)
-
-        # Speaker name
-        name_label = QLabel(self.entry.speaker_name)
-        name_label.setStyleSheet(
-            f"color: {self.entry.speaker_color}; "
-            f"font-weight: bold; "
-            f"font-size: 12px;"
+        if translated:
+            height += self.LINE_SPACING + translated + 2 * self.TEXT_PADDING
+        return QSize(width, height + self.GAP)
+
+    def paint(self, painter: QPainter, option, index):
+        """Draw the bubble: accent, speaker dot and name, language, time and text."""
+        entry = index.data(ENTRY_ROLE)
+        speaker_color = entry.speaker_color
+        bubble = QRectF(option.rect.adjusted(0, 0, 0, -self.GAP))
+        original_height, translated_height = self._measure(entry, option.rect.width())
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Background and accent
+        outline = QPainterPath()
+        outline.addRoundedRect(bubble, self.RADIUS, self.RADIUS)
+        painter.fillPath(outline, self.BUBBLE_COLOR)
+        painter.setClipPath(outline)
+        painter.fillRect(
+            QRectF(bubble.left(), bubble.top(), self.ACCENT_WIDTH, bubble.height()),
+            speaker_color,
         )
-        header_layout.addWidget(name_label)
-
-        # Language indicator
-        lang_label = QLabel(f"[{self.entry.language.upper()}]")
-        lang_label.setStyleSheet("color: #64748b; font-size: 10px;")
-        header_layout.addWidget(lang_label)
-
-        header_layout.addStretch()
-
-        # Timestamp
-        time_str = self.entry.timestamp.strftime("%H:%M:%S")
-        time_label = QLabel(time_str)
-        time_label.setStyleSheet("color: #64748b; font-size: 10px;")
-        header_layout.addWidget(time_label)
-
-        layout.addLayout(header_layout)
+        painter.setClipping(False)
+
+        left = int(bubble.left()) + self.ACCENT_WIDTH + self.PADDING_X
+        right = int(bubble.right()) - self.PADDING_X
+        top = int(bubble.top()) + self.PADDING_Y
+        text_width = self._text_width(option.rect.width())
+        header = QRect(left, top, right - left, self._header_height)
+        middle = Qt.AlignmentFlag.AlignVCenter
+
+        # Header: dot, name and language on the left, time on the right
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(speaker_color)
+        dot_top = top + (self._header_height - self.DOT_SIZE) / 2
+        painter.drawEllipse(QRectF(left, dot_top, self.DOT_SIZE, self.DOT_SIZE))
+        x = left + self.DOT_SIZE + self.SPACING
+
+        painter.setFont(self._name_font)
+        painter.setPen(speaker_color)
+        painter.drawText(header.adjusted(x - left, 0, 0, 0), middle, entry.speaker_name)
+        x += self._name_metrics.horizontalAdvance(entry.speaker_name) + self.SPACING
+
+        painter.setFont(self._meta_font)
+        painter.setPen(self.META_COLOR)
+        painter.drawText(
+            header.adjusted(x - left, 0, 0, 0), middle, f"[{entry.language.upper()}]"
+        )
+        painter.drawText(header, middle | Qt.AlignmentFlag.AlignRight, entry.time_text)
 
         # Original text
-        original_label = QLabel(self.entry.original_text)
-        original_label.setWordWrap(True)
-        original_label.setStyleSheet(
-            "color: #e2e8f0; "
-            "font-size: 14px; "
-            "padding: 4px 0;"
-        )
-        layout.addWidget(original_label)
-
-        # Translation (if different)
-        if self.entry.translated_text and self.entry.translated_text != self.entry.original_text:
-            translation_label = QLabel(self.entry.translated_text)
-            translation_label.setWordWrap(True)
-            translation_label.setStyleSheet(
-                "color: #94a3b8; "
-                "font-size: 13px; "
-                "font-style: italic; "
-                "padding: 4px 0; "
-                "border-left: 2px solid #334155; "
-                "padding-left: 8px;"
+        wrap = Qt.TextFlag.TextWordWrap
+        y = top + self._header_height + self.LINE_SPACING + self.TEXT_PADDING
+        painter.setFont(self._original_font)
+        painter.setPen(self.ORIGINAL_COLOR)
+        painter.drawText(QRect(left, y, text_width, original_height), wrap, entry.original_text)
+
+        # Translation, set off by a border on its left
+        if translated_height:
+            y += original_height + self.TEXT_PADDING + self.LINE_SPACING
+            painter.fillRect(
+                QRect(left, y, 2, translated_height + 2 * self.TEXT_PADDING), self.QUOTE_COLOR
             )
-            layout.addWidget(translation_label)
-
-        # Style the bubble
-        self.setStyleSheet(
-            f"TranscriptBubble {{"
-            f"  background-color: #1e293b;"
-            f"  border-radius: 8px;"
-            f"  border-left: 3px solid {self.entry.speaker_color};"
-            f"}}"
-            f"QLabel {{"
-            f"  background-color: transparent;"
-            f"}}"
-        )
+            y += self.TEXT_PADDING
+            painter.setFont(self._translation_font)
+            painter.setPen(self.TRANSLATION_COLOR)
+            indent = self.QUOTE_INDENT
+            translation_rect = QRect(left + indent, y, text_width - indent, translated_height)
+            painter.drawText(translation_rect, wrap, self._translation(entry))
+
+        painter.restore()
 
 
 class TranscriptPanel(QWidget):
-    """Panel showing the conversation transcript with speaker diarization."""
+    """
+    Panel showing the conversation transcript with speaker diarization.
+
+    Entries are shown through a TranscriptModel and painted by a BubbleDelegate, so only
+    the visible ones cost any work. New entries are buffered and handed to the model
+    together on a short timer, so a burst of results costs one layout pass.
+    """
 
     cleared = pyqtSignal()
 
+    # Delay before pending entries are added to the view, in milliseconds
+    FLUSH_INTERVAL_MS = 16
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._entries: list[TranscriptEntry] = []
-        self._speaker_colors: list[str] = [
-            "#3b82f6",  # Blue (user)
-            "#ef4444",  # Red
-            "#22c55e",  # Green
-            "#f59e0b",  # Orange
-            "#8b5cf6",  # Purple
-            "#ec4899",  # Pink
-            "#14b8a6",  # Teal
-            "#f97316",  # Deep orange
+        self._pending: list[TranscriptEntry] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
+        self._speaker_colors: list[QColor] = [
+            QColor("#3b82f6"),  # Blue (user)
+            QColor("#ef4444"),  # Red
+            QColor("#22c55e"),  # Green
+            QColor("#f59e0b"),  # Orange
+            QColor("#8b5cf6"),  # Purple
+            QColor("#ec4899"),  # Pink
+            QColor("#14b8a6"),  # Teal
+            QColor("#f97316"),  # Deep orange
         ]
+        self._update_palette_index()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -145,60 +302,56 @@ class TranscriptPanel(QWidget):
 
         # Header
         header = QWidget()
+        header.setObjectName("transcriptHeader")
         header.setFixedHeight(40)
-        header.setStyleSheet("background-color: #0f172a;")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(16, 0, 16, 0)
 
         title = QLabel("Conversation")
-        title.setStyleSheet("color: #e2e8f0; font-size: 14px; font-weight: bold;")
+        title.setObjectName("transcriptTitle")
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         layout.addWidget(header)
 
-        # Scroll area for messages
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea {"
-            "  background-color: #0f172a;"
-            "  border: none;"
-            "}"
-            "QScrollBar:vertical {"
-            "  background-color: #1e293b;"
-            "  width: 8px;"
-            "}"
-            "QScrollBar::handle:vertical {"
-            "  background-color: #334155;"
-            "  border-radius: 4px;"
-            "}"
-            "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {"
-            "  height: 0px;"
-            "}"
-        )
-
-        # Container for messages
-        self._container = QWidget()
-        self._container.setStyleSheet("background-color: #0f172a;")
-        self._messages_layout = QVBoxLayout(self._container)
-        self._messages_layout.setContentsMargins(16, 16, 16, 16)
-        self._messages_layout.setSpacing(12)
-
-        scroll.setWidget(self._container)
-        layout.addWidget(scroll)
-
-        self._scroll = scroll
+        # Message list
+        self._model = TranscriptModel(self._entries, self)
+        view = QListView()
+        view.setObjectName("transcriptView")
+        view.setModel(self._model)
+        self._delegate = BubbleDelegate(view)
+        view.setItemDelegate(self._delegate)
+        view.setUniformItemSizes(False)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setResizeMode(QListView.ResizeMode.Adjust)
+        view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        view.setSpacing(0)
+        layout.addWidget(view)
+
+        self._view = view
 
     def set_speaker_colors(self, colors: list[str]):
-        """Set the speaker color palette."""
-        self._speaker_colors = colors
+        """Set the speaker color palette from hex color strings, parsed once here."""
+        self._speaker_colors = [QColor(color) for color in colors]
+        self._update_palette_index()
+
+    def _update_palette_index(self):
+        """Cache the palette size, and a bit mask for it when it is a power of two."""
+        self._palette_len = len(self._speaker_colors)
+        if self._palette_len & (self._palette_len - 1) == 0:
+            self._palette_mask = self._palette_len - 1
+        else:
+            self._palette_mask = None
 
-    def get_speaker_color(self, speaker_id: int) -> str:
+    def get_speaker_color(self, speaker_id: int) -> QColor:
         """Get color for a speaker ID."""
-        return self._speaker_colors[speaker_id % len(self._speaker_colors)]
+        if self._palette_mask is not None:
+            return self._speaker_colors[speaker_id & self._palette_mask]
+        return self._speaker_colors[speaker_id % self._palette_len]
 
     def add_entry(
         self,
@@ -208,43 +361,89 @@ class TranscriptPanel(QWidget):
         speaker_name: str,
         language: str,
         is_user: bool = False,
+        timestamp: Optional[datetime] = None,
     ):
-        """Add a new transcript entry."""
+        """
+        Add a new transcript entry.
+
+        Args:
+            timestamp: When the entry was spoken; defaults to now
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
         entry = TranscriptEntry(
             original_text=original_text,
             translated_text=translated_text,
             speaker_id=speaker_id,
             speaker_name=speaker_name,
             speaker_color=self.get_speaker_color(speaker_id),
-            timestamp=datetime.now(),
+            timestamp=timestamp,
+            time_text=f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}",
             language=language,
             is_user=is_user,
         )
-        self._entries.append(entry)
-
-        # Add bubble widget at top (newest first)
-        bubble = TranscriptBubble(entry)
-        self._messages_layout.insertWidget(0, bubble)
+        self._pending.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(self.FLUSH_INTERVAL_MS)
+
+    def add_entries(self, entries: list[dict]):
+        """
+        Add several transcript entries.
+
+        Args:
+            entries: Keyword arguments for add_entry(), one dict per entry
+        """
+        for entry in entries:
+            self.add_entry(**entry)
+
+    def _flush(self):
+        """Hand all pending entries to the model in one insertion."""
+        pending, self._pending = self._pending, []
+        self._model.add_entries(pending)
+        # The newest entry is the top row
+        self._view.scrollToTop()
 
     def clear(self):
         """Clear all entries."""
-        self._entries.clear()
-
-        # Remove all bubbles
-        while self._messages_layout.count() > 0:
-            item = self._messages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._pending.clear()
+        self._flush_timer.stop()
+        self._model.clear()
+        self._delegate.clear_cache()
 
         self.cleared.emit()
 
 
+class ColorDot(QWidget):
+    """A small filled circle in one color, painted directly instead of styled."""
+
+    def __init__(self, color: QColor, size: int, parent=None):
+        super().__init__(parent)
+        self._color = color
+        self.setFixedSize(size, size)
+
+    def set_color(self, color: QColor):
+        """Change the dot color."""
+        if color != self._color:
+            self._color = color
+            self.update()
+
+    def paintEvent(self, event):
+        """Paint the dot."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._color)
+        painter.drawEllipse(self.rect())
+
+
 class StatusBar(QWidget):
     """Status bar showing listening state and language info."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(32)
+        # Let the APP_QSS background and border apply to this plain QWidget subclass
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -254,32 +453,24 @@ class StatusBar(QWidget):
         layout.setSpacing(16)
 
         # Status indicator
-        self._status_dot = QLabel()
-        self._status_dot.setFixedSize(8, 8)
-        self._status_dot.setStyleSheet(
-            "background-color: #64748b; border-radius: 4px;"
-        )
+        self._status_dot = ColorDot(QColor("#64748b"), 8)
         layout.addWidget(self._status_dot)
 
         self._status_label = QLabel("Ready")
-        self._status_label.setStyleSheet("color: #94a3b8; font-size: 12px;")
+        self._status_label.setObjectName("statusText")
         layout.addWidget(self._status_label)
 
         layout.addStretch()
 
         # Language display
         self._lang_label = QLabel("HU → EN")
-        self._lang_label.setStyleSheet("color: #64748b; font-size: 11px;")
+        self._lang_label.setObjectName("statusLanguages")
         layout.addWidget(self._lang_label)
 
-        self.setStyleSheet("background-color: #0f172a; border-top: 1px solid #1e293b;")
-
     def set_status(self, status: str, color: str = "#64748b"):
         """Set the status text and color."""
         self._status_label.setText(status)
-        self._status_dot.setStyleSheet(
-            f"background-color: {color}; border-radius: 4px;"
-        )
+        self._status_dot.set_color(QColor(color))
 
     def set_listening(self, listening: bool):
         """Set listening state."""
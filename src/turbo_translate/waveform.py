@@ -1,16 +1,30 @@
 """Animated waveform orb widget with blue theme."""
 
-import math
-import random
-
+import numpy as np
 from PyQt6.QtCore import QPointF, Qt, QTimer
-from PyQt6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen, QRadialGradient
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
 from PyQt6.QtWidgets import QWidget
 
 
 class WaveformWidget(QWidget):
     """Animated blob-style waveform visualization."""
 
+    # Glow layers drawn behind the blob for a depth effect, as (scale, alpha): outer, mid
+    GLOW_LAYERS = ((1.3, 0.1), (1.15, 0.2))
+
+    # Animation timer intervals in milliseconds: ~60 FPS while active, slower when idle
+    FRAME_INTERVAL_MS = 16
+    IDLE_INTERVAL_MS = 100
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(150, 150)
@@ -19,45 +33,107 @@ class WaveformWidget(QWidget):
         self._primary_color = QColor("#3b82f6")  # Blue
         self._glow_color = QColor("#60a5fa")  # Light blue
         self._bg_color = QColor("#0f172a")  # Dark blue
+        self._derive_colors()
 
         # Animation state
         self._level = 0.0
         self._target_level = 0.0
         self._phase = 0.0
+        self._two_pi = 2 * np.pi
         self._is_listening = False
         self._is_processing = False
 
         # Blob parameters
         self._num_points = 32
         self._base_radius = 0.35
-        self._noise_offsets = [random.random() * 100 for _ in range(self._num_points)]
+        self._noise_offsets = np.random.random(self._num_points) * 100
+
+        # Per-point terms that never change; paintEvent computes all points as arrays
+        angles = np.linspace(0, 2 * np.pi, self._num_points, endpoint=False)
+        self._cos_a = np.cos(angles)
+        self._sin_a = np.sin(angles)
+        self._angles_3 = angles * 3
+        self._angles_5 = angles * 5
+        self._noise_steps = np.arange(self._num_points) * 0.5
+        self._idle_steps = np.arange(self._num_points) * 0.2
 
-        # Animation timer
+        # Per-point peak of the latest audio samples, rippling the outline while listening
+        self._ripple = np.zeros(self._num_points)
+
+        # Reused by _scale_path()
+        self._transform = QTransform()
+
+        # Glow layers, rendered into a pixmap that is reused until the coarse state changes
+        self._glow_cache: QPixmap | None = None
+        self._glow_cache_key: tuple | None = None
+
+        # Animation timer; runs only while the widget is shown
         self._timer = QTimer(self)
+        self._timer.setInterval(self.FRAME_INTERVAL_MS)
         self._timer.timeout.connect(self._update_animation)
-        self._timer.start(16)  # ~60 FPS
 
     def set_colors(self, primary: str, glow: str, background: str):
         """Set the color scheme."""
         self._primary_color = QColor(primary)
         self._glow_color = QColor(glow)
         self._bg_color = QColor(background)
+        self._derive_colors()
         self.update()
 
+    def _derive_colors(self):
+        """Precompute the colors paintEvent needs from the current scheme."""
+        self._gradient_light = self._lighten(self._primary_color, 0.3)
+        self._gradient_dark = self._darken(self._primary_color, 0.3)
+
+        # Main blob brush and glow pixmap, rebuilt on demand with the new colors
+        self._blob_brush = None
+        self._blob_brush_size = None
+        self._glow_cache_key = None
+
+        # One translucent glow color per glow layer, keyed by layer alpha
+        self._glow_layer_colors = {}
+        for alpha in (0.1, 0.2):
+            glow = QColor(self._glow_color)
+            glow.setAlphaF(alpha * 0.3)
+            self._glow_layer_colors[alpha] = glow
+
     def set_level(self, level: float):
         """Set the audio level (0.0 to 1.0)."""
         self._target_level = max(0.0, min(1.0, level))
 
+    def set_samples(self, samples: np.ndarray):
+        """Set recent audio samples (float, -1.0 to 1.0) shown as ripples on the orb."""
+        n = self._num_points
+        usable = samples.size - samples.size % n
+        if usable == 0:
+            self._ripple = np.zeros(n)
+            return
+        self._ripple = np.abs(samples[:usable]).reshape(n, -1).max(axis=1)
+
     def set_listening(self, listening: bool):
         """Set whether actively listening."""
         self._is_listening = listening
+        if listening:
+            self._timer.setInterval(self.FRAME_INTERVAL_MS)
         self.update()
 
     def set_processing(self, processing: bool):
         """Set whether processing audio."""
         self._is_processing = processing
+        if processing:
+            self._timer.setInterval(self.FRAME_INTERVAL_MS)
         self.update()
 
+    def showEvent(self, event):
+        """Start animating when the widget becomes visible."""
+        super().showEvent(event)
+        self._timer.start()
+
+    def hideEvent(self, event):
+        """Stop animating while the widget is hidden."""
+        super().hideEvent(event)
+        self._timer.stop()
+
     def _update_animation(self):
         """Update animation state."""
         # Smooth level transition
@@ -67,16 +143,26 @@ class WaveformWidget(QWidget):
         if not self._is_listening:
             self._target_level *= 0.95
 
-        # Advance phase
-        self._phase += 0.02
-        if self._phase > math.pi * 2:
-            self._phase -= math.pi * 2
+        # Only the subtle idle animation is left: drop to the slower cadence
+        interval = self._timer.interval()
+        if (
+            interval != self.IDLE_INTERVAL_MS
+            and self._level < 1e-3
+            and not self._is_listening
+            and not self._is_processing
+        ):
+            self._timer.setInterval(self.IDLE_INTERVAL_MS)
+
+        # Advance phase, at the same speed whatever the cadence
+        self._phase += 0.02 * interval / self.FRAME_INTERVAL_MS
+        if self._phase > self._two_pi:
+            self._phase -= self._two_pi
 
         self.update()
 
-    def _noise(self, x: float, offset: float) -> float:
+    def _noise(self, x: np.ndarray, offset: np.ndarray) -> np.ndarray:
         """Simple noise function for organic movement."""
-        return math.sin(x + offset) * 0.5 + math.sin(x * 2.3 + offset * 1.7) * 0.3
+        return np.sin(x + offset) * 0.5 + np.sin(x * 2.3 + offset * 1.7) * 0.3
 
     def paintEvent(self, event):
         """Paint the waveform visualization."""
@@ -93,67 +179,13 @@ class WaveformWidget(QWidget):
         # Fill background
         painter.fillRect(self.rect(), self._bg_color)
 
-        # Calculate blob points
-        points = []
-        for i in range(self._num_points):
-            angle = (i / self._num_points) * math.pi * 2
-
-            # Base radius
-            radius = self._base_radius * size
-
-            # Add audio-reactive deformation
-            if self._is_listening:
-                # Multiple frequency components
-                wave1 = math.sin(angle * 3 + self._phase * 2) * self._level * 0.15
-                wave2 = math.sin(angle * 5 - self._phase * 3) * self._level * 0.1
-                wave3 = self._noise(self._phase * 2 + i * 0.5, self._noise_offsets[i]) * 0.05
-
-                radius *= 1 + wave1 + wave2 + wave3
-
-                # Breathing effect
-                radius *= 1 + math.sin(self._phase) * 0.02
-            elif self._is_processing:
-                # Pulsing effect when processing
-                pulse = math.sin(self._phase * 3) * 0.1
-                radius *= 1 + pulse
-            else:
-                # Subtle idle animation
-                radius *= 1 + math.sin(self._phase + i * 0.2) * 0.02
-
-            x = cx + math.cos(angle) * radius
-            y = cy + math.sin(angle) * radius
-            points.append(QPointF(x, y))
+        path = self._build_blob_path(w, h)
 
-        # Create smooth path through points
-        path = self._create_smooth_path(points)
-
-        # Draw layers for depth effect
-        layers = [
-            (1.3, 0.1),  # Outer glow
-            (1.15, 0.2),  # Mid glow
-            (1.0, 1.0),  # Main blob
-        ]
-
-        for scale, alpha in layers:
-            scaled_path = self._scale_path(path, cx, cy, scale)
-
-            if scale == 1.0:
-                # Main blob with gradient
-                gradient = QRadialGradient(cx, cy, size * 0.4)
-                gradient.setColorAt(0, self._lighten(self._primary_color, 0.3))
-                gradient.setColorAt(0.7, self._primary_color)
-                gradient.setColorAt(1, self._darken(self._primary_color, 0.3))
-
-                painter.setBrush(QBrush(gradient))
-                painter.setPen(Qt.PenStyle.NoPen)
-            else:
-                # Glow layers
-                glow = QColor(self._glow_color)
-                glow.setAlphaF(alpha * 0.3)
-                painter.setBrush(QBrush(glow))
-                painter.setPen(Qt.PenStyle.NoPen)
-
-            painter.drawPath(scaled_path)
+        # Glow layers, then the main blob with gradient on top
+        painter.drawPixmap(0, 0, self._get_glow_pixmap(w, h, path))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._get_blob_brush(w, h))
+        painter.drawPath(path)
 
         # Draw status indicator
         if self._is_listening:
@@ -161,44 +193,109 @@ class WaveformWidget(QWidget):
         elif self._is_processing:
             self._draw_status_dot(painter, cx, cy + size * 0.25, "#f59e0b")  # Orange
 
-    def _create_smooth_path(self, points: list[QPointF]) -> QPainterPath:
-        """Create a smooth closed path through points using Bezier curves."""
-        if len(points) < 3:
+    def _get_blob_brush(self, w: int, h: int) -> QBrush:
+        """Return the main blob's radial gradient brush, built once per widget size."""
+        if self._blob_brush is None or self._blob_brush_size != (w, h):
+            gradient = QRadialGradient(w / 2, h / 2, min(w, h) * 0.4)
+            gradient.setColorAt(0, self._gradient_light)
+            gradient.setColorAt(0.7, self._primary_color)
+            gradient.setColorAt(1, self._gradient_dark)
+            self._blob_brush = QBrush(gradient)
+            self._blob_brush_size = (w, h)
+        return self._blob_brush
+
+    def _get_glow_pixmap(self, w: int, h: int, path: QPainterPath) -> QPixmap:
+        """
+        Return the glow layers rendered into a transparent pixmap.
+
+        The glow is soft and low-frequency, so the pixmap is only redrawn (from the given
+        blob path) when the size, state or level rounded to 0.1 changes.
+        """
+        key = (w, h, round(self._level, 1), self._is_listening, self._is_processing)
+        if self._glow_cache is None or key != self._glow_cache_key:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(round(w * ratio), round(h * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            for scale, alpha in self.GLOW_LAYERS:
+                painter.setBrush(QBrush(self._glow_layer_colors[alpha]))
+                painter.drawPath(self._scale_path(path, w / 2, h / 2, scale))
+            painter.end()
+
+            self._glow_cache = pixmap
+            self._glow_cache_key = key
+        return self._glow_cache
+
+    def _build_blob_path(self, w: int, h: int) -> QPainterPath:
+        """Build the smooth blob outline for the current animation frame."""
+        cx = w / 2
+        cy = h / 2
+        size = min(w, h)
+
+        # Calculate blob point radii, all points at once
+        phase = self._phase
+        level = self._level
+        if self._is_listening:
+            # Audio-reactive deformation from multiple frequency components
+            wave1 = np.sin(self._angles_3 + phase * 2) * (level * 0.15)
+            wave2 = np.sin(self._angles_5 - phase * 3) * (level * 0.1)
+            wave3 = self._noise(self._noise_steps + phase * 2, self._noise_offsets) * 0.05
+            deform = 1 + wave1 + wave2 + wave3 + self._ripple * 0.08
+
+            # Breathing effect
+            deform *= 1 + np.sin(phase) * 0.02
+        elif self._is_processing:
+            # Pulsing effect when processing
+            deform = 1 + np.sin(phase * 3) * 0.1
+        else:
+            # Subtle idle animation
+            deform = 1 + np.sin(self._idle_steps + phase) * 0.02
+        radius = self._base_radius * size * deform
+
+        xs = cx + self._cos_a * radius
+        ys = cy + self._sin_a * radius
+
+        # Create smooth path through points
+        return self._create_smooth_path(xs, ys)
+
+    def _create_smooth_path(self, xs: np.ndarray, ys: np.ndarray) -> QPainterPath:
+        """
+        Create a smooth closed path through points using Bezier curves.
+
+        The control points are computed as arrays and passed to cubicTo() as plain floats,
+        so building the path allocates no QPointF objects.
+
+        Args:
+            xs: Point x coordinates
+            ys: Point y coordinates
+        """
+        if len(xs) < 3:
             return QPainterPath()
 
-        path = QPainterPath()
-        n = len(points)
-
-        # Start at first point
-        path.moveTo(points[0])
-
-        for i in range(n):
-            p0 = points[(i - 1) % n]
-            p1 = points[i]
-            p2 = points[(i + 1) % n]
-            p3 = points[(i + 2) % n]
-
-            # Calculate control points
-            tension = 0.3
-            cp1 = QPointF(
-                p1.x() + (p2.x() - p0.x()) * tension,
-                p1.y() + (p2.y() - p0.y()) * tension,
-            )
-            cp2 = QPointF(
-                p2.x() - (p3.x() - p1.x()) * tension,
-                p2.y() - (p3.y() - p1.y()) * tension,
-            )
-
-            path.cubicTo(cp1, cp2, p2)
+        # Segment i runs from point i (p1) to point i + 1 (p2); p0 and p3 are its neighbours
+        tension = 0.3
+        x2, y2 = np.roll(xs, -1), np.roll(ys, -1)
+        cp1x = xs + (x2 - np.roll(xs, 1)) * tension
+        cp1y = ys + (y2 - np.roll(ys, 1)) * tension
+        cp2x = x2 - (np.roll(xs, -2) - xs) * tension
+        cp2y = y2 - (np.roll(ys, -2) - ys) * tension
+        segments = np.column_stack((cp1x, cp1y, cp2x, cp2y, x2, y2)).tolist()
 
+        path = QPainterPath()
+        path.moveTo(float(xs[0]), float(ys[0]))
+        for segment in segments:
+            path.cubicTo(*segment)
         path.closeSubpath()
         return path
 
     def _scale_path(self, path: QPainterPath, cx: float, cy: float, scale: float) -> QPainterPath:
         """Scale a path around a center point."""
-        from PyQt6.QtGui import QTransform
-
-        transform = QTransform()
+        transform = self._transform
+        transform.reset()
         transform.translate(cx, cy)
         transform.scale(scale, scale)
         transform.translate(-cx, -cy)
@@ -214,15 +311,9 @@ class WaveformWidget(QWidget):
     def _lighten(self, color: QColor, amount: float) -> QColor:
         """Lighten a color."""
         h, s, l, a = color.getHslF()
-        l = min(1.0, l + amount)
-        result = QColor()
-        result.setHslF(h, s, l, a)
-        return result
+        return QColor.fromHslF(h, s, min(1.0, l + amount), a)
 
     def _darken(self, color: QColor, amount: float) -> QColor:
         """Darken a color."""
         h, s, l, a = color.getHslF()
-        l = max(0.0, l - amount)
-        result = QColor()
-        result.setHslF(h, s, l, a)
-        return result
+        return QColor.fromHslF(h, s, max(0.0, l - amount), a)